@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import datetime as dt
+import gzip
 import hashlib
 import json
 import os
@@ -38,14 +39,7 @@ def parse_ocr_engines(values: list[str]) -> list[str]:
     for value in values:
         parts = [part.strip() for part in value.split(",") if part.strip()]
         engines.extend(parts)
-    unique: list[str] = []
-    seen: set[str] = set()
-    for engine in engines:
-        if engine in seen:
-            continue
-        seen.add(engine)
-        unique.append(engine)
-    return unique
+    return list(dict.fromkeys(engines))
 
 
 def normalize_token_header(token: str) -> str:
@@ -62,14 +56,18 @@ def read_token_file(path: Path) -> str:
 
 
 def api_get_json(url: str, headers: dict[str, str], verify_tls: bool, timeout: int) -> dict | list:
-    req = urllib.request.Request(url=url, headers=headers, method="GET")
+    # Document listings are large, highly compressible JSON; let the server gzip them.
+    req = urllib.request.Request(url=url, headers={"Accept-Encoding": "gzip", **headers}, method="GET")
     context = None
     if not verify_tls:
         context = ssl._create_unverified_context()  # noqa: S323
     try:
         with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body)
+            raw = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            # json.loads accepts UTF-8 bytes directly, so skip the intermediate str.
+            return json.loads(raw)
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
         raise RuntimeError(f"HTTP {exc.code} for {url}: {detail}") from exc
@@ -173,6 +171,7 @@ def fetch_all_documents(
     verify_tls: bool,
     timeout: int,
     progress_cb=None,
+    get_json=api_get_json,
 ) -> list[dict]:
     headers = {
         "Accept": "application/json",
@@ -186,7 +185,7 @@ def fetch_all_documents(
 
     while next_url:
         page_no += 1
-        payload = api_get_json(next_url, headers=headers, verify_tls=verify_tls, timeout=timeout)
+        payload = get_json(next_url, headers=headers, verify_tls=verify_tls, timeout=timeout)
 
         if isinstance(payload, dict):
             results = payload.get("results")
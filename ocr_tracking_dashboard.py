@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 import base64
+import concurrent.futures
 import datetime as dt
+import gzip
 import hashlib
+import heapq
+import http.client
 import json
+import operator
 import os
 import queue
+import random
 import re
 import socket
 import sqlite3
@@ -15,7 +21,9 @@ import tkinter as tk
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import Callable
 from pathlib import Path
+from typing import NamedTuple
 from tkinter import messagebox
 from tkinter.scrolledtext import ScrolledText
 from tkinter import ttk
@@ -23,6 +31,19 @@ from tkinter import ttk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import BOTH, END, LEFT, W, X
 
+try:
+    import orjson  # Optional: faster JSON encoding for RAG exports and API response parsing.
+except ImportError:
+    orjson = None
+
+
+def loads_json(raw: bytes | str) -> object:
+    # orjson when installed; json.loads also takes UTF-8 bytes directly, skipping a decode copy.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # Reuse API/token helpers from tracking script to stay aligned with one API path.
 from init_ocr_tracking_db import (  # type: ignore
     DEFAULT_API_BASE_URL,
@@ -38,6 +59,21 @@ from init_ocr_tracking_db import (  # type: ignore
 DATA_MEMORY_DIR = Path("data_memory")
 DATA_OUT_DIR = Path("data_out")
 API_OCR_HISTORY_PATH = DATA_MEMORY_DIR / "api_ocr_history.jsonl"
+# History rows saved at shutdown as JSON; bump the version whenever the cached layout changes.
+API_OCR_HISTORY_CACHE_PATH = DATA_MEMORY_DIR / "api_ocr_history.cache.json"
+HISTORY_CACHE_VERSION = 2
+# Row fields kept in the cache, in order. Each cached row continues with _doc_id, _run_dt as
+# [Y, m, d, H, M, S] or null, and for success rows the sort keys below.
+HISTORY_CACHE_FIELDS = (
+    "run_ts",
+    "id",
+    "title",
+    "pre_content_length",
+    "post_content_length",
+    "content_delta",
+    "status",
+    "detail",
+)
 PIPELINE_DB_PATH = DATA_MEMORY_DIR / "ocr_pipeline.sqlite3"
 RAG_INGESTION_ROOT = DATA_OUT_DIR / "rag_ingestion"
 DASHBOARD_SETTINGS_PATH = DATA_MEMORY_DIR / "ocr_dashboard_settings.json"
@@ -47,11 +83,46 @@ DEFAULT_LLM_TIMEOUT_SECONDS = 180
 DEFAULT_LLM_RETRY_ATTEMPTS = 2
 LLM_RETRY_BACKOFF_SECONDS = 2.0
 SETTINGS_AUTOSAVE_DELAY_MS = 500
+# Integer settings parsed once per edit by the StringVar trace: attribute -> (field label, minimum).
+CACHED_INT_VARS = {
+    "page_size": ("Page Size", 1),
+    "timeout": ("Timeout", 1),
+    "batch_size": ("Batch size", 1),
+    "recent_days": ("Exclude days", 0),
+    "prospective_threshold": ("Prospective threshold", 0),
+    "prospective_recent_days": ("Prospective exclude days", 0),
+}
+LOG_VIEW_MAX_LINES = 5000
+# Log drain tick: quick while messages keep arriving, relaxed once the queue goes quiet.
+LOG_DRAIN_BUSY_MS = 50
+LOG_DRAIN_IDLE_MS = 250
 
 BATCH_OPTIONS = tuple([str(i) for i in range(5, 101, 5)] + ["250", "500", "1000"])
-TASK_POLL_INTERVAL_SECONDS = 2.0
+TASK_POLL_INITIAL_DELAY_SECONDS = 0.5
+TASK_POLL_MAX_DELAY_SECONDS = 5.0
+TASK_POLL_BACKOFF_FACTOR = 1.5
+TASK_POLL_JITTER_RATIO = 0.2
+TASK_POLL_MAX_WORKERS = 8
+TASK_SUBMIT_MAX_WORKERS = 4
+DOC_FETCH_MAX_WORKERS = 16
+DOC_BULK_FETCH_CHUNK = 100
+DOC_SNAPSHOT_CACHE_TTL_SECONDS = 2.5
+TASK_LISTING_MAX_AGE_SECONDS = 1.0
+# The shared listing downloads every unacknowledged task (stock Paperless sends no ETag), so it only
+# pays off once enough tasks are in flight; below this, per-task polls are cheaper.
+TASK_LISTING_MIN_PENDING_TASKS = 32
+TASK_LONGPOLL_WAIT_SECONDS = 30
+TASK_LONGPOLL_PROBE_WAIT_SECONDS = 2
+TASK_STATE_CLASSES = {
+    **dict.fromkeys(("SUCCESS", "SUCCEEDED", "DONE", "COMPLETED", "COMPLETE", "FINISHED"), "success"),
+    **dict.fromkeys(("FAILURE", "FAILED", "ERROR", "REVOKED", "CANCELED", "CANCELLED"), "failure"),
+}
+# Outcomes where nothing was sent for the document, so it cannot have changed and needs no post-run fetch.
+POST_FETCH_SKIP_DETAIL_PREFIXES = ("submit_error=", "no_task_id_payload=")
 NO_TASK_DIFF_POLL_INTERVAL_SECONDS = 5.0
 NO_TASK_DIFF_MAX_WAIT_SECONDS = 600.0
+TASK_ID_KEYS = ("task_id", "task_ids", "id", "task", "uuid")
+LOG_ID_DIGITS_RE = re.compile(r"\d+")
 UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
 ENGINE_PAPERLESS = "paperless_internal"
 ENGINE_LLM = "llm_openai_compatible"
@@ -70,7 +141,227 @@ SUCCESS_SORT_FIELDS = (
     ("Delta", "content_delta"),
     ("Status", "status"),
 )
+# Per-row attribute holding the precomputed sort key for each OCR History sort field.
+SUCCESS_SORT_ROW_KEYS = {field: f"_sort_{field}" for _, field in SUCCESS_SORT_FIELDS}
+# Sort keys stored in the history cache; the run_ts key is rebuilt from _run_dt.
+HISTORY_CACHE_SORT_KEYS = tuple(row_key for field, row_key in SUCCESS_SORT_ROW_KEYS.items() if field != "run_ts")
 SUCCESS_SORT_ORDERS = ("Descending", "Ascending")
+RUN_BITSET_MIN_DOCS = 1024
+HISTORY_STREAM_CHUNK_ROWS = 200
+API_POOL_MAX_CONNECTIONS = 16
+API_RETRY_STATUSES = frozenset({502, 503, 504})
+API_RETRY_ATTEMPTS = 3
+API_RETRY_BACKOFF_SECONDS = 0.3
+
+
+class DocSnapshot(NamedTuple):
+    """Fields compared before and after a reprocess to spot a change without a task id."""
+
+    modified: object
+    content_length: int
+    archive_filename: str
+    page_count: object
+
+
+EMPTY_DOC_SNAPSHOT = DocSnapshot(None, 0, "", None)
+
+
+class RunIdBitset:
+    """Set-like progress tracker for large runs, packed as one bit per run position."""
+
+    __slots__ = ("_positions", "_bits", "_count", "_extra")
+
+    def __init__(self, doc_ids: list[int]) -> None:
+        self._positions = {doc_id: pos for pos, doc_id in enumerate(doc_ids)}
+        self._bits = bytearray((len(doc_ids) + 7) // 8)
+        self._count = 0
+        # IDs outside the run (should not happen) still count, like they would in a plain set.
+        self._extra: set[int] = set()
+
+    def add(self, doc_id: int) -> None:
+        pos = self._positions.get(doc_id)
+        if pos is None:
+            self._extra.add(doc_id)
+            return
+        mask = 1 << (pos & 7)
+        if not self._bits[pos >> 3] & mask:
+            self._bits[pos >> 3] |= mask
+            self._count += 1
+
+    def __contains__(self, doc_id: object) -> bool:
+        pos = self._positions.get(doc_id)  # type: ignore[arg-type]
+        if pos is None:
+            return doc_id in self._extra
+        return bool(self._bits[pos >> 3] & (1 << (pos & 7)))
+
+    def __len__(self) -> int:
+        return self._count + len(self._extra)
+
+
+class ApiConnectionPool:
+    """Keep-alive HTTP(S) connections to one API origin, shared by all dashboard threads."""
+
+    def __init__(self, base_url: str, verify_tls: bool, maxsize: int = API_POOL_MAX_CONNECTIONS) -> None:
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme.lower()
+        self._host = parsed.hostname or ""
+        self._port = parsed.port
+        self._context = None
+        if self.scheme == "https" and not verify_tls:
+            self._context = ssl._create_unverified_context()  # noqa: S323
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=maxsize)
+        self._closed = False
+
+    def request_bytes(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        body: bytes | None = None,
+    ) -> bytes:
+        status, raw, _ = self._request(method, url, headers, timeout, body)
+        if status >= 400:
+            detail = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {status} for {url}: {detail}")
+        return raw
+
+    def request_json(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        body: bytes | None = None,
+    ) -> dict | list:
+        raw = self.request_bytes(method, url, headers=headers, timeout=timeout, body=body)
+        if method != "GET" and not raw.strip():
+            return {}
+        return self._decode_json(url, raw)
+
+    def request_status(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        body: bytes | None = None,
+    ) -> tuple[int, bytes]:
+        # For callers that handle HTTP error statuses themselves (e.g. their own retry policy).
+        status, raw, _ = self._request(method, url, headers, timeout, body)
+        return status, raw
+
+    def get_json_if_none_match(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        etag: str | None,
+    ) -> tuple[dict | list | None, str | None]:
+        # Conditional GET: (None, etag) when the server answers 304 Not Modified.
+        if etag:
+            headers = {**headers, "If-None-Match": etag}
+        status, raw, new_etag = self._request("GET", url, headers, timeout, None)
+        if status == 304:
+            return None, etag
+        if status >= 400:
+            detail = raw.decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {status} for {url}: {detail}")
+        return self._decode_json(url, raw), new_etag
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _decode_json(self, url: str, raw: bytes) -> dict | list:
+        try:
+            return loads_json(raw)  # type: ignore[return-value]
+        except ValueError as exc:
+            raise RuntimeError(f"API returned non-JSON response for {url}") from exc
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: int,
+        body: bytes | None,
+    ) -> tuple[int, bytes, str | None]:
+        parsed = urllib.parse.urlsplit(url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += f"?{parsed.query}"
+        # Only idempotent GETs are retried on gateway errors.
+        attempts = API_RETRY_ATTEMPTS if method == "GET" else 1
+        for attempt in range(attempts):
+            status, raw, etag = self._send(method, url, path, headers, timeout, body)
+            if status not in API_RETRY_STATUSES or attempt + 1 >= attempts:
+                break
+            time.sleep(API_RETRY_BACKOFF_SECONDS * (2**attempt))
+        return status, raw, etag
+
+    def _new_connection(self, timeout: int) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout, context=self._context)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _checkout(self, timeout: int) -> http.client.HTTPConnection:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection(timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        if self._closed:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        headers: dict[str, str],
+        timeout: int,
+        body: bytes | None,
+    ) -> tuple[int, bytes, str | None]:
+        if "Accept-Encoding" not in headers:
+            headers = {**headers, "Accept-Encoding": "gzip"}
+        # An idle keep-alive socket may have been dropped by the server; retry once on a fresh one.
+        for fresh in (False, True):
+            conn = self._new_connection(timeout) if fresh else self._checkout(timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                if fresh:
+                    raise RuntimeError(f"Network error for {url}: {exc}") from exc
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise RuntimeError(f"Network error for {url}: {exc}") from exc
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(conn)
+            if raw and resp.getheader("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            return resp.status, raw, resp.getheader("ETag")
+        raise AssertionError("unreachable")
 
 
 class OcrDashboard(tb.Window):
@@ -84,11 +375,49 @@ class OcrDashboard(tb.Window):
         self.export_active = False
         self.stop_event = threading.Event()
         self.log_queue: queue.Queue[str] = queue.Queue()
-        self.log_file_lock = threading.Lock()
         self.history_file_lock = threading.Lock()
+        # Parsed history rows and the byte offset/inode they cover; later loads parse only the tail.
+        self._history_rows: tuple[list[dict], list[dict]] = ([], [])
+        self._history_offset = 0
+        self._history_inode: int | None = None
+        # Latest dated history row per doc id, kept current by the tail reader.
+        self._history_latest: dict[int, dict] = {}
+        self.task_listing_lock = threading.Lock()
+        self._task_listing: dict[str, dict] = {}
+        self._task_listing_ts = 0.0
+        self._task_listing_etag: str | None = None
+        self._task_listing_enabled = True
+        # Submitted tasks not yet terminal, and the in-flight listing fetch other pollers wait on.
+        self._task_listing_pending = 0
+        self._task_listing_refresh: concurrent.futures.Future | None = None
+        self._server_supports_longpoll = False
+        self._token_cache: tuple[tuple[str, str], str] | None = None
+        self.api_pools_lock = threading.Lock()
+        # Normalized document snapshots from recent per-doc GETs: doc_id -> (monotonic ts, doc).
+        self.doc_cache_lock = threading.Lock()
+        self._doc_cache: dict[int, tuple[float, dict]] = {}
+        self._api_pools: dict[tuple[str, str, bool], ApiConnectionPool] = {}
         self.log_file_path = DATA_MEMORY_DIR / "dashboard.log"
         self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log_fh = self.log_file_path.open("a", encoding="utf-8", buffering=1 << 14)
+        # The log writer thread is the only one touching _log_fh; emitters just enqueue.
+        self._file_log_queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._file_log_thread = threading.Thread(target=self._file_log_loop, name="file-log-writer", daemon=True)
+        self._file_log_thread.start()
         self.history_file_path = API_OCR_HISTORY_PATH
+        self.history_cache_path = API_OCR_HISTORY_CACHE_PATH
+        self._history_cache_key: tuple[int, int] | None = None
+        # History appends run on one writer thread so workers never block on file I/O;
+        # a single consumer keeps rows in submission order.
+        self._history_writer_queue: queue.Queue[tuple[list[dict], Callable[[], None] | None] | None] = (
+            queue.Queue()
+        )
+        self._history_writer_thread = threading.Thread(
+            target=self._history_writer_loop,
+            name="history-writer",
+            daemon=True,
+        )
+        self._history_writer_thread.start()
         self.pipeline_db_path = PIPELINE_DB_PATH
         self.settings_file_path = DASHBOARD_SETTINGS_PATH
         self.rag_root_dir = RAG_INGESTION_ROOT
@@ -99,31 +428,42 @@ class OcrDashboard(tb.Window):
         self.llm_api_mode_help_window: tk.Toplevel | None = None
 
         self.docs: list[dict] = []
+        self.docs_by_id: dict[int, dict] = {}
+        # Casefolded UTF-8 (search haystack, modified) per doc, parallel to self.docs.
+        self.docs_search_index: list[tuple[bytes, bytes]] = []
+        # Pre-cast fields per doc, parallel to self.docs; see _build_docs_fields for the layout.
+        self.docs_fields: list[tuple[int, str, int, str, str, str, int | None, str]] = []
         self.recent_manual_ids: set[int] = set()
         self.success_rows: list[dict] = []
         self.failed_rows: list[dict] = []
 
         self.selected_candidates: list[dict] = []
+        self.selected_candidates_by_id: dict[int, dict] = {}
         self.prospective_rows: list[dict] = []
         self.pdf_search_rows: list[dict] = []
+        self.pdf_search_by_id: dict[int, dict] = {}
         self.pipeline_rows: list[dict] = []
         self.run_total = 0
-        self.run_completed_ids: set[int] = set()
-        self.run_started_ids: set[int] = set()
+        self.run_completed_ids: set[int] | RunIdBitset = set()
+        self.run_started_ids: set[int] | RunIdBitset = set()
         self.progress_scope = "Idle"
+        self._progress_dirty = False
         self.progress_text = tk.StringVar(value="Idle | 0/0 (0%) | Pending: 0")
         self.progress_value = tk.DoubleVar(value=0.0)
         self.paperless_fetch_status = tk.StringVar(value="Paperless overview last fetched: never")
         self.tree_sort_state: dict[str, dict[str, bool]] = {}
+        # Parsed sort keys per (tree, column); dropped whenever _fill_tree replaces the rows.
+        self._sort_cache: dict[tuple[str, str], list[tuple]] = {}
         self._ensure_pipeline_schema()
 
         self._build_ui()
+        self._register_int_var_cache()
         self._load_saved_settings()
         self._register_settings_autosave()
         self.refresh_pipeline_overview()
         self.protocol("WM_DELETE_WINDOW", self._on_window_close)
         self._append_file_log(f"\n===== DASHBOARD START {dt.datetime.now().isoformat()} =====\n")
-        self.after(100, self._drain_log_queue)
+        self.after(LOG_DRAIN_IDLE_MS, self._drain_log_queue)
 
     def _build_ui(self) -> None:
         root = tb.Frame(self, padding=10)
@@ -152,12 +492,33 @@ class OcrDashboard(tb.Window):
         self.notebook.add(self.tab_settings, text="Settings")
         self.notebook.add(self.tab_log, text="Activity Log")
 
+        # Settings-backed variables of the lazily built tabs must exist before settings load.
+        self.prospective_threshold = tk.StringVar(value="120")
+        self.prospective_recent_days = tk.StringVar(value="14")
+        self.pdf_query = tk.StringVar(value="")
+        self.pdf_modified_contains = tk.StringVar(value="")
+        self.pdf_missing_archive_only = tk.BooleanVar(value=False)
+        self.pdf_exclude_recent_days = tk.StringVar(value="0")
+        self.pdf_min_chars = tk.StringVar(value="")
+        self.pdf_max_chars = tk.StringVar(value="")
+        self.pdf_min_pages = tk.StringVar(value="")
+        self.pdf_max_pages = tk.StringVar(value="")
+        self.success_sort_field = tk.StringVar(value=SUCCESS_SORT_FIELDS[0][0])
+        self.success_sort_order = tk.StringVar(value=SUCCESS_SORT_ORDERS[0])
+
+        # Tree-heavy tabs are built on first activation; refreshes requested before that
+        # are recorded in _stale_lazy_tabs and replayed once the tab exists.
+        self._lazy_tabs: dict[str, tuple[Callable[[], None], Callable[[], None]]] = {
+            str(self.tab_pdf_search): (self._build_pdf_search_tab, self.refresh_pdf_search),
+            str(self.tab_prospective): (self._build_prospective_tab, self.refresh_prospective),
+            str(self.tab_pipeline): (self._build_pipeline_tab, self.refresh_pipeline_overview),
+            str(self.tab_success): (self._build_success_tab, self.refresh_success_tab),
+        }
+        self._stale_lazy_tabs: set[str] = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         self._build_run_tab()
-        self._build_pdf_search_tab()
-        self._build_prospective_tab()
-        self._build_pipeline_tab()
         self._build_rag_tab()
-        self._build_success_tab()
         self._build_top_controls(self.tab_settings)
         self.log = ScrolledText(self.tab_log, wrap="word")
         self.log.pack(fill=BOTH, expand=True)
@@ -174,6 +535,24 @@ class OcrDashboard(tb.Window):
             bootstyle="success-striped",
         ).pack(side=LEFT, fill=X, expand=True)
 
+    def _on_tab_changed(self, _event: object = None) -> None:
+        name = self.notebook.select()
+        lazy = self._lazy_tabs.pop(name, None)
+        if lazy is None:
+            return
+        build, refresh = lazy
+        build()
+        if name in self._stale_lazy_tabs:
+            self._stale_lazy_tabs.discard(name)
+            refresh()
+
+    def _defer_if_unbuilt(self, tab: tk.Widget) -> bool:
+        name = str(tab)
+        if name not in self._lazy_tabs:
+            return False
+        self._stale_lazy_tabs.add(name)
+        return True
+
     def _build_step1_controls(self, parent: tk.Widget) -> None:
         controls = tb.Labelframe(parent, text="Step 1: Candidate Set", padding=8)
         controls.pack(fill=X, pady=(0, 8))
@@ -590,6 +969,7 @@ class OcrDashboard(tb.Window):
 
         self._delete_file_if_exists(self.settings_file_path)
         self._delete_file_if_exists(DEFAULT_TOKEN_FILE)
+        self._token_cache = None
         self._delete_file_if_exists(DEFAULT_LLM_KEY_FILE)
         self._delete_file_if_exists(LEGACY_LLM_KEY_FILE)
         self._save_settings(show_error=False)
@@ -811,9 +1191,6 @@ class OcrDashboard(tb.Window):
             command=self.refresh_success_history_only,
         ).pack(side=LEFT)
 
-        self.success_sort_field = tk.StringVar(value=SUCCESS_SORT_FIELDS[0][0])
-        self.success_sort_order = tk.StringVar(value=SUCCESS_SORT_ORDERS[0])
-
         tb.Label(controls, text="Sort by").pack(side=LEFT, padx=(12, 6))
         success_sort_field_box = tb.Combobox(
             controls,
@@ -849,9 +1226,6 @@ class OcrDashboard(tb.Window):
         controls = tb.Frame(self.tab_prospective)
         controls.pack(fill=X)
 
-        self.prospective_threshold = tk.StringVar(value="120")
-        self.prospective_recent_days = tk.StringVar(value="14")
-
         tb.Label(controls, text="Chars <").pack(side=LEFT, padx=(0, 6))
         tb.Entry(controls, textvariable=self.prospective_threshold, width=8).pack(side=LEFT, padx=(0, 12))
 
@@ -883,11 +1257,6 @@ class OcrDashboard(tb.Window):
         filters_row_1 = tb.Frame(self.tab_pdf_search)
         filters_row_1.pack(fill=X)
 
-        self.pdf_query = tk.StringVar(value="")
-        self.pdf_modified_contains = tk.StringVar(value="")
-        self.pdf_missing_archive_only = tk.BooleanVar(value=False)
-        self.pdf_exclude_recent_days = tk.StringVar(value="0")
-
         tb.Label(filters_row_1, text="Search").pack(side=LEFT, padx=(0, 6))
         tb.Entry(filters_row_1, textvariable=self.pdf_query, width=28).pack(side=LEFT, padx=(0, 12))
 
@@ -907,11 +1276,6 @@ class OcrDashboard(tb.Window):
         filters_row_2 = tb.Frame(self.tab_pdf_search)
         filters_row_2.pack(fill=X, pady=(8, 0))
 
-        self.pdf_min_chars = tk.StringVar(value="")
-        self.pdf_max_chars = tk.StringVar(value="")
-        self.pdf_min_pages = tk.StringVar(value="")
-        self.pdf_max_pages = tk.StringVar(value="")
-
         tb.Label(filters_row_2, text="Chars min").pack(side=LEFT, padx=(0, 6))
         tb.Entry(filters_row_2, textvariable=self.pdf_min_chars, width=8).pack(side=LEFT, padx=(0, 12))
 
@@ -1010,8 +1374,12 @@ class OcrDashboard(tb.Window):
     def _sort_tree_by_column(self, tree: ttk.Treeview, column: str) -> None:
         sort_state = self.tree_sort_state.get(str(tree), {})
         ascending = sort_state.get(column, True)
-        items = [(tree.set(k, column), k) for k in tree.get_children("")]
-        items.sort(key=lambda pair: self._sort_key(pair[0]), reverse=not ascending)
+        cache_key = (str(tree), column)
+        items = self._sort_cache.get(cache_key)
+        if items is None:
+            items = [(self._sort_key(tree.set(k, column)), k) for k in tree.get_children("")]
+            self._sort_cache[cache_key] = items
+        items.sort(key=operator.itemgetter(0), reverse=not ascending)
         for index, (_, item_id) in enumerate(items):
             tree.move(item_id, "", index)
         sort_state[column] = not ascending
@@ -1026,7 +1394,7 @@ class OcrDashboard(tb.Window):
 
     def _success_row_sort_key(self, row: dict, field: str):
         if field == "run_ts":
-            parsed = self._parse_run_ts_to_dt(str(row.get("run_ts", "")))
+            parsed = row["_run_dt"]
             return parsed if parsed is not None else dt.datetime.min
         if field in {"id", "pre_content_length", "post_content_length", "content_delta"}:
             try:
@@ -1040,18 +1408,70 @@ class OcrDashboard(tb.Window):
         self.log_queue.put(msg)
 
     def _append_file_log(self, msg: str) -> None:
-        with self.log_file_lock:
-            with self.log_file_path.open("a", encoding="utf-8") as f:
-                f.write(msg)
+        self._file_log_queue.put(msg)
+
+    def _file_log_loop(self) -> None:
+        while True:
+            batch = [self._file_log_queue.get()]
+            # Coalesce whatever piled up while the last batch was written.
+            while True:
+                try:
+                    batch.append(self._file_log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            if stop:
+                batch = batch[: batch.index(None)]
+            try:
+                self._log_fh.writelines(batch)
+                self._log_fh.flush()
+            except (OSError, ValueError):
+                pass
+            if stop:
+                self._log_fh.close()
+                return
 
     def _append_history_rows(self, rows: list[dict]) -> None:
         if not rows:
             return
+        # Encode outside the lock and hand the file one writelines call.
+        if orjson is not None:
+            lines = [orjson.dumps(row) + b"\n" for row in rows]
+        else:
+            lines = [
+                json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+                for row in rows
+            ]
         self.history_file_path.parent.mkdir(parents=True, exist_ok=True)
         with self.history_file_lock:
-            with self.history_file_path.open("a", encoding="utf-8") as f:
-                for row in rows:
-                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            with self.history_file_path.open("ab", buffering=1 << 16) as f:
+                f.writelines(lines)
+
+    def _history_writer_loop(self) -> None:
+        while True:
+            item = self._history_writer_queue.get()
+            if item is None:
+                return
+            rows, on_written = item
+            try:
+                self._append_history_rows(rows)
+            except Exception as exc:
+                self._emit(f"[ERROR] Failed to append API OCR history rows: {exc}\n")
+            if on_written is not None:
+                try:
+                    on_written()
+                except Exception as exc:
+                    self._emit(f"[ERROR] History post-write callback failed: {exc}\n")
+
+    def _post_run_ui_refresh(self) -> None:
+        # Runs on the Tk thread once the run's history rows are on disk: one event-queue
+        # trip for the whole post-run UI update instead of one per widget.
+        self.success_rows, self.failed_rows = self._load_api_history_rows()
+        self._update_control_states()
+        self.refresh_success_tab()
+        self.refresh_pipeline_overview()
+        self._set_progress_scope("Idle")
+        self._render_progress()
 
     def _ensure_pipeline_schema(self) -> None:
         conn = sqlite3.connect(str(self.pipeline_db_path))
@@ -1098,9 +1518,51 @@ class OcrDashboard(tb.Window):
         llm_model: str = "",
         paperless_update_status: str = "",
     ) -> None:
+        self._record_pipeline_events(
+            [
+                {
+                    "doc_id": doc_id,
+                    "title": title,
+                    "action": action,
+                    "engine": engine,
+                    "status": status,
+                    "note": note,
+                    "rag_md_path": rag_md_path,
+                    "rag_json_path": rag_json_path,
+                    "text_sha256": text_sha256,
+                    "llm_provider": llm_provider,
+                    "llm_model": llm_model,
+                    "paperless_update_status": paperless_update_status,
+                }
+            ]
+        )
+
+    def _record_pipeline_events(self, events: list[dict]) -> None:
+        # Takes the same keys as _record_pipeline_event; one connection and one commit per batch.
+        if not events:
+            return
+        event_ts = dt.datetime.now(dt.timezone.utc).isoformat()
+        rows = [
+            (
+                event_ts,
+                event["doc_id"],
+                event["title"],
+                event["action"],
+                event["engine"],
+                event["status"],
+                event.get("note", ""),
+                event.get("rag_md_path", ""),
+                event.get("rag_json_path", ""),
+                event.get("text_sha256", ""),
+                event.get("llm_provider", ""),
+                event.get("llm_model", ""),
+                event.get("paperless_update_status", ""),
+            )
+            for event in events
+        ]
         conn = sqlite3.connect(str(self.pipeline_db_path))
         try:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO pipeline_events (
                     event_ts, doc_id, title, action, engine, status, note,
@@ -1109,21 +1571,7 @@ class OcrDashboard(tb.Window):
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    dt.datetime.now(dt.timezone.utc).isoformat(),
-                    doc_id,
-                    title,
-                    action,
-                    engine,
-                    status,
-                    note,
-                    rag_md_path,
-                    rag_json_path,
-                    text_sha256,
-                    llm_provider,
-                    llm_model,
-                    paperless_update_status,
-                ),
+                rows,
             )
             conn.commit()
         finally:
@@ -1150,35 +1598,37 @@ class OcrDashboard(tb.Window):
             conn.close()
 
     def _drain_log_queue(self) -> None:
+        chunks: list[str] = []
         try:
             while True:
                 msg = self.log_queue.get_nowait()
-                self.log.insert(END, msg)
-                self.log.see(END)
+                chunks.append(msg)
                 self._update_progress_from_log_line(msg)
         except queue.Empty:
             pass
-        self.after(100, self._drain_log_queue)
+        # One Text insert and scroll per tick instead of one Tk round-trip per message.
+        if chunks:
+            self.log.insert(END, "".join(chunks))
+            # Cap scrollback so long runs don't make every insert and re-layout slower.
+            excess = int(self.log.index("end-1c").split(".")[0]) - LOG_VIEW_MAX_LINES
+            if excess > 0:
+                self.log.delete("1.0", f"{excess + 1}.0")
+            self.log.see(END)
+        # Per-doc [START]/[OK]/[FAIL] lines only mark progress dirty; redraw once per drain tick.
+        if self._progress_dirty:
+            self._render_progress()
+        self.after(LOG_DRAIN_BUSY_MS if chunks else LOG_DRAIN_IDLE_MS, self._drain_log_queue)
 
     def _extract_id_from_line(self, line: str) -> int | None:
-        marker = "ID="
-        pos = line.find(marker)
+        # Only the digits right after the first "ID=" count, as before.
+        pos = line.find("ID=")
         if pos < 0:
             return None
-        value = []
-        for ch in line[pos + len(marker) :]:
-            if ch.isdigit():
-                value.append(ch)
-            else:
-                break
-        if not value:
-            return None
-        try:
-            return int("".join(value))
-        except ValueError:
-            return None
+        match = LOG_ID_DIGITS_RE.match(line, pos + 3)
+        return int(match.group()) if match else None
 
     def _render_progress(self) -> None:
+        self._progress_dirty = False
         total = max(self.run_total, 0)
         completed = len(self.run_completed_ids)
         pending = max(total - completed, 0)
@@ -1188,6 +1638,16 @@ class OcrDashboard(tb.Window):
             f"{self.progress_scope} | {completed}/{total} ({percent:.0f}%) | Pending: {pending}"
         )
 
+    def _new_run_id_set(self, doc_ids: list[int]) -> set[int] | RunIdBitset:
+        if len(doc_ids) > RUN_BITSET_MIN_DOCS:
+            return RunIdBitset(doc_ids)
+        return set()
+
+    def _reset_run_progress(self, doc_ids: list[int]) -> None:
+        self.run_total = len(doc_ids)
+        self.run_completed_ids = self._new_run_id_set(doc_ids)
+        self.run_started_ids = self._new_run_id_set(doc_ids)
+
     def _set_progress_scope(self, scope: str) -> None:
         self.progress_scope = scope
         self._render_progress()
@@ -1197,14 +1657,14 @@ class OcrDashboard(tb.Window):
             doc_id = self._extract_id_from_line(line)
             if doc_id is not None:
                 self.run_started_ids.add(doc_id)
-                self._render_progress()
+                self._progress_dirty = True
             return
 
         if line.startswith("[OK]") or line.startswith("[FAIL]"):
             doc_id = self._extract_id_from_line(line)
             if doc_id is not None:
                 self.run_completed_ids.add(doc_id)
-                self._render_progress()
+                self._progress_dirty = True
             return
 
         if line.startswith("Summary:"):
@@ -1215,15 +1675,23 @@ class OcrDashboard(tb.Window):
 
     def _get_token(self) -> str:
         typed = self.api_token.get().strip()
-        if typed:
-            self._write_secret_file(DEFAULT_TOKEN_FILE, typed)
-            return typed
-
         env_token = os.environ.get("PAPERLESS_API_TOKEN", "").strip()
-        if env_token:
-            return env_token
+        # Re-resolve only when the entry or environment changed; avoids rewriting or
+        # re-reading the token file on every call.
+        source = (typed, env_token)
+        if self._token_cache is not None and self._token_cache[0] == source:
+            return self._token_cache[1]
 
-        return read_token_file(DEFAULT_TOKEN_FILE)
+        if typed:
+            self._write_secret_file(DEFAULT_TOKEN_FILE, typed)
+            token = typed
+        elif env_token:
+            token = env_token
+        else:
+            token = read_token_file(DEFAULT_TOKEN_FILE)
+        # A missing token file may be created later, so only remember real tokens.
+        self._token_cache = (source, token) if token else None
+        return token
 
     def _safe_int(self, raw: str, field: str, minimum: int = 1) -> int:
         try:
@@ -1234,6 +1702,27 @@ class OcrDashboard(tb.Window):
             raise ValueError(f"{field} must be >= {minimum}")
         return val
 
+    def _register_int_var_cache(self) -> None:
+        # Parsed value or error message per CACHED_INT_VARS entry. Refreshes (and worker threads)
+        # read this dict instead of calling into Tcl and re-validating on every click.
+        self._int_var_values: dict[str, int | str] = {}
+        for name in CACHED_INT_VARS:
+            getattr(self, name).trace_add("write", lambda *_, name=name: self._recache_int_var(name))
+            self._recache_int_var(name)
+
+    def _recache_int_var(self, name: str) -> None:
+        field, minimum = CACHED_INT_VARS[name]
+        try:
+            self._int_var_values[name] = self._safe_int(getattr(self, name).get().strip(), field, minimum=minimum)
+        except ValueError as exc:
+            self._int_var_values[name] = str(exc)
+
+    def _cached_int(self, name: str) -> int:
+        value = self._int_var_values[name]
+        if isinstance(value, str):
+            raise ValueError(value)
+        return value
+
     def _safe_optional_int(self, raw: str, field: str, minimum: int = 0) -> int | None:
         text = (raw or "").strip()
         if not text:
@@ -1247,6 +1736,56 @@ class OcrDashboard(tb.Window):
             "Authorization": normalize_token_header(token),
         }
 
+    def _api_pool_for(self, url: str, verify_tls: bool) -> ApiConnectionPool | None:
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https"):
+            return None
+        # http.client ignores HTTP(S)_PROXY/NO_PROXY; proxied hosts go through urllib instead.
+        if urllib.request.getproxies().get(scheme) and not urllib.request.proxy_bypass(parsed.hostname or ""):
+            return None
+        key = (scheme, parsed.netloc, verify_tls)
+        with self.api_pools_lock:
+            pool = self._api_pools.get(key)
+            if pool is None:
+                pool = ApiConnectionPool(f"{scheme}://{parsed.netloc}", verify_tls)
+                self._api_pools[key] = pool
+            return pool
+
+    def _close_api_pools(self) -> None:
+        with self.api_pools_lock:
+            pools = list(self._api_pools.values())
+            self._api_pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def _api_get_json(
+        self,
+        url: str,
+        headers: dict[str, str],
+        verify_tls: bool,
+        timeout: int,
+    ) -> dict | list:
+        # Keep-alive pools are shared per origin so polls and fetches skip the TCP/TLS handshake.
+        pool = self._api_pool_for(url, verify_tls)
+        if pool is None:
+            return api_get_json(url, headers=headers, verify_tls=verify_tls, timeout=timeout)
+        return pool.request_json("GET", url, headers=headers, timeout=timeout)
+
+    def _api_get_json_if_changed(
+        self,
+        url: str,
+        headers: dict[str, str],
+        verify_tls: bool,
+        timeout: int,
+        etag: str | None,
+    ) -> tuple[dict | list | None, str | None]:
+        # Returns (None, etag) when the server confirms the previous response is still current.
+        pool = self._api_pool_for(url, verify_tls)
+        if pool is None:
+            return api_get_json(url, headers=headers, verify_tls=verify_tls, timeout=timeout), None
+        return pool.get_json_if_none_match(url, headers=headers, timeout=timeout, etag=etag)
+
     def _api_post_json(
         self,
         url: str,
@@ -1255,24 +1794,7 @@ class OcrDashboard(tb.Window):
         verify_tls: bool,
         timeout: int,
     ) -> dict | list:
-        body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url=url, headers=headers, method="POST", data=body)
-        context = None
-        if not verify_tls:
-            context = ssl._create_unverified_context()  # noqa: S323
-        try:
-            with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-                raw = resp.read().decode("utf-8")
-                if not raw.strip():
-                    return {}
-                return json.loads(raw)
-        except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"HTTP {exc.code} for {url}: {detail}") from exc
-        except urllib.error.URLError as exc:
-            raise RuntimeError(f"Network error for {url}: {exc}") from exc
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(f"API returned non-JSON response for {url}") from exc
+        return self._api_send_json("POST", url, headers, payload, verify_tls, timeout)
 
     def _api_patch_json(
         self,
@@ -1281,18 +1803,32 @@ class OcrDashboard(tb.Window):
         payload: dict,
         verify_tls: bool,
         timeout: int,
+    ) -> dict | list:
+        return self._api_send_json("PATCH", url, headers, payload, verify_tls, timeout)
+
+    def _api_send_json(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        payload: dict,
+        verify_tls: bool,
+        timeout: int,
     ) -> dict | list:
         body = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(url=url, headers=headers, method="PATCH", data=body)
+        pool = self._api_pool_for(url, verify_tls)
+        if pool is not None:
+            return pool.request_json(method, url, headers=headers, timeout=timeout, body=body)
+        req = urllib.request.Request(url=url, headers=headers, method=method, data=body)
         context = None
         if not verify_tls:
             context = ssl._create_unverified_context()  # noqa: S323
         try:
             with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-                raw = resp.read().decode("utf-8")
+                raw = resp.read()
                 if not raw.strip():
                     return {}
-                return json.loads(raw)
+                return loads_json(raw)
         except urllib.error.HTTPError as exc:
             detail = exc.read().decode("utf-8", errors="replace")
             raise RuntimeError(f"HTTP {exc.code} for {url}: {detail}") from exc
@@ -1308,6 +1844,9 @@ class OcrDashboard(tb.Window):
         verify_tls: bool,
         timeout: int,
     ) -> bytes:
+        pool = self._api_pool_for(url, verify_tls)
+        if pool is not None:
+            return pool.request_bytes("GET", url, headers=headers, timeout=timeout)
         req = urllib.request.Request(url=url, headers=headers, method="GET")
         context = None
         if not verify_tls:
@@ -1329,7 +1868,7 @@ class OcrDashboard(tb.Window):
         timeout: int,
         verify_tls: bool,
     ) -> dict:
-        payload = api_get_json(
+        payload = self._api_get_json(
             f"{base_url}/api/documents/{doc_id}/",
             headers=headers,
             verify_tls=verify_tls,
@@ -1409,7 +1948,10 @@ class OcrDashboard(tb.Window):
             md_path.write_text("\n".join(md_lines), encoding="utf-8")
             written_md = str(md_path)
         if export_mode in {"both", "json_only"}:
-            json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            if orjson is not None:
+                json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
             written_json = str(json_path)
 
         return written_md, written_json
@@ -1444,18 +1986,44 @@ class OcrDashboard(tb.Window):
         retry_attempts: int = 0,
     ) -> dict | list:
         body = json.dumps(payload).encode("utf-8")
+        # LLM calls reuse keep-alive connections too, so only the first call pays the TLS handshake.
+        pool = self._api_pool_for(url, verify_tls)
         req = urllib.request.Request(url=url, headers=headers, method="POST", data=body)
         context = None
         if not verify_tls:
             context = ssl._create_unverified_context()  # noqa: S323
         attempts = max(1, retry_attempts + 1)
         for attempt in range(1, attempts + 1):
+            if pool is not None:
+                try:
+                    status, raw = pool.request_status("POST", url, headers=headers, timeout=timeout, body=body)
+                except RuntimeError as exc:
+                    if attempt < attempts:
+                        self._emit(
+                            f"[WARN]  LLM API network error (attempt {attempt}/{attempts}): {exc}. Retrying...\n"
+                        )
+                        time.sleep(LLM_RETRY_BACKOFF_SECONDS * attempt)
+                        continue
+                    raise
+                if status >= 400:
+                    if 500 <= status < 600 and attempt < attempts:
+                        self._emit(f"[WARN]  LLM API HTTP {status} (attempt {attempt}/{attempts}), retrying...\n")
+                        time.sleep(LLM_RETRY_BACKOFF_SECONDS * attempt)
+                        continue
+                    detail = raw.decode("utf-8", errors="replace")
+                    raise RuntimeError(f"HTTP {status} for {url}: {detail}")
+                if not raw.strip():
+                    return {}
+                try:
+                    return loads_json(raw)
+                except ValueError as exc:
+                    raise RuntimeError(f"LLM API returned non-JSON response for {url}") from exc
             try:
                 with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-                    raw = resp.read().decode("utf-8")
+                    raw = resp.read()
                     if not raw.strip():
                         return {}
-                    return json.loads(raw)
+                    return loads_json(raw)
             except urllib.error.HTTPError as exc:
                 detail = exc.read().decode("utf-8", errors="replace")
                 if 500 <= exc.code < 600 and attempt < attempts:
@@ -1603,36 +2171,25 @@ class OcrDashboard(tb.Window):
         return self._extract_llm_text(raw)
 
     def _iter_possible_task_ids(self, obj) -> list[str]:
+        # Iterative preorder walk that visits each container once; task-id-like keys are
+        # walked before the remaining values so they win when a payload carries several UUIDs.
         found: list[str] = []
-        if obj is None:
-            return found
-        if isinstance(obj, str):
-            candidate = obj.strip()
-            if UUID_RE.match(candidate):
-                return [candidate]
-            return []
-        if isinstance(obj, list):
-            for item in obj:
-                found.extend(self._iter_possible_task_ids(item))
-            return found
-        if isinstance(obj, dict):
-            for key in ("task_id", "task_ids", "id", "task", "uuid"):
-                if key in obj:
-                    found.extend(self._iter_possible_task_ids(obj.get(key)))
-            for value in obj.values():
-                found.extend(self._iter_possible_task_ids(value))
-            return found
+        stack = [obj]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                candidate = item.strip()
+                if UUID_RE.fullmatch(candidate):
+                    found.append(candidate)
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
+            elif isinstance(item, dict):
+                stack.extend(reversed([value for key, value in item.items() if key not in TASK_ID_KEYS]))
+                stack.extend(reversed([item[key] for key in TASK_ID_KEYS if key in item]))
         return found
 
     def _extract_task_ids(self, payload: dict | list) -> list[str]:
-        dedup: list[str] = []
-        seen: set[str] = set()
-        for task_id in self._iter_possible_task_ids(payload):
-            if task_id in seen:
-                continue
-            seen.add(task_id)
-            dedup.append(task_id)
-        return dedup
+        return list(dict.fromkeys(self._iter_possible_task_ids(payload)))
 
     def _task_state_from_payload(self, payload: dict | list) -> tuple[str, str]:
         task_obj = None
@@ -1666,12 +2223,105 @@ class OcrDashboard(tb.Window):
         return state, detail
 
     def _classify_task_state(self, raw_state: str) -> str:
-        state = (raw_state or "").upper()
-        if state in {"SUCCESS", "SUCCEEDED", "DONE", "COMPLETED", "COMPLETE", "FINISHED"}:
-            return "success"
-        if state in {"FAILURE", "FAILED", "ERROR", "REVOKED", "CANCELED", "CANCELLED"}:
-            return "failure"
-        return "pending"
+        return TASK_STATE_CLASSES.get((raw_state or "").upper(), "pending")
+
+    def _reset_task_listing(self) -> None:
+        with self.task_listing_lock:
+            self._task_listing = {}
+            self._task_listing_ts = 0.0
+            self._task_listing_etag = None
+            self._task_listing_enabled = True
+            self._task_listing_pending = 0
+            self._task_listing_refresh = None
+
+    def _track_pending_task(self, delta: int) -> None:
+        with self.task_listing_lock:
+            self._task_listing_pending += delta
+
+    def _task_obj_from_listing(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        task_id: str,
+        timeout: int,
+        verify_tls: bool,
+    ) -> dict | None:
+        # /api/tasks/ only filters on a single task_id, so with many tasks in flight concurrent
+        # pollers share one listing of unacknowledged tasks per tick instead of issuing one GET each.
+        with self.task_listing_lock:
+            if not self._task_listing_enabled or self._task_listing_pending < TASK_LISTING_MIN_PENDING_TASKS:
+                return None
+            if time.monotonic() - self._task_listing_ts < TASK_LISTING_MAX_AGE_SECONDS:
+                return self._task_listing.get(task_id)
+            refresh = self._task_listing_refresh
+            fetching = refresh is None
+            if fetching:
+                # Single flight: this poller fetches outside the lock, the others wait on the future.
+                refresh = self._task_listing_refresh = concurrent.futures.Future()
+                etag = self._task_listing_etag
+        if not fetching:
+            try:
+                return refresh.result().get(task_id)
+            except Exception:
+                return None
+        try:
+            payload, etag = self._api_get_json_if_changed(
+                f"{base_url}/api/tasks/?acknowledged=false",
+                headers=headers,
+                verify_tls=verify_tls,
+                timeout=timeout,
+                etag=etag,
+            )
+        except Exception as exc:
+            with self.task_listing_lock:
+                if self._task_listing_refresh is refresh:
+                    self._task_listing_enabled = False
+                    self._task_listing_refresh = None
+            refresh.set_exception(exc)
+            return None
+        listing: dict[str, dict] | None = None
+        if payload is not None:
+            if isinstance(payload, dict):
+                payload = payload.get("results")
+            listing = {}
+            if isinstance(payload, list):
+                for item in payload:
+                    if isinstance(item, dict) and item.get("task_id"):
+                        listing[str(item["task_id"])] = item
+        with self.task_listing_lock:
+            # A reset for a new run while this fetch was out leaves the new run's state alone.
+            if self._task_listing_refresh is refresh:
+                if listing is not None:
+                    self._task_listing = listing
+                self._task_listing_etag = etag
+                self._task_listing_ts = time.monotonic()
+                self._task_listing_refresh = None
+            if listing is None:
+                listing = self._task_listing
+        refresh.set_result(listing)
+        return listing.get(task_id)
+
+    def _probe_task_longpoll(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        timeout: int,
+        verify_tls: bool,
+    ) -> bool:
+        # Stock Paperless ignores unknown query params, so only a response that actually
+        # held the request open for the requested wait counts as long-poll support.
+        probe_url = f"{base_url}/api/tasks/?task_id=longpoll-probe&wait={TASK_LONGPOLL_PROBE_WAIT_SECONDS}"
+        start_ts = time.monotonic()
+        try:
+            self._api_get_json(
+                probe_url,
+                headers=headers,
+                verify_tls=verify_tls,
+                timeout=timeout + TASK_LONGPOLL_PROBE_WAIT_SECONDS,
+            )
+        except Exception:
+            return False
+        return time.monotonic() - start_ts >= TASK_LONGPOLL_PROBE_WAIT_SECONDS * 0.8
 
     def _poll_task_until_terminal(
         self,
@@ -1682,34 +2332,77 @@ class OcrDashboard(tb.Window):
         verify_tls: bool,
     ) -> tuple[str, str]:
         task_url = f"{base_url}/api/tasks/?task_id={urllib.parse.quote(task_id)}"
+        longpoll_url = f"{task_url}&wait={TASK_LONGPOLL_WAIT_SECONDS}"
+        stop_is_set = self.stop_event.is_set
+        delay = TASK_POLL_INITIAL_DELAY_SECONDS
+        last_state = ""
+        etag: str | None = None
+        last_payload: dict | list = []
         while True:
-            if self.stop_event.is_set():
+            if stop_is_set():
                 return "ABORTED", "Stopped by user"
-            payload = api_get_json(task_url, headers=headers, verify_tls=verify_tls, timeout=timeout)
+            request_ts = time.monotonic()
+            if self._server_supports_longpoll:
+                try:
+                    payload: dict | list = self._api_get_json(
+                        longpoll_url,
+                        headers=headers,
+                        verify_tls=verify_tls,
+                        timeout=timeout + TASK_LONGPOLL_WAIT_SECONDS,
+                    )
+                except RuntimeError as exc:
+                    if not str(exc).startswith(("HTTP 400", "HTTP 404")):
+                        raise
+                    self._server_supports_longpoll = False
+                    continue
+            else:
+                task_obj = self._task_obj_from_listing(base_url, headers, task_id, timeout, verify_tls)
+                if task_obj is not None:
+                    payload = [task_obj]
+                else:
+                    fresh_payload, etag = self._api_get_json_if_changed(
+                        task_url,
+                        headers=headers,
+                        verify_tls=verify_tls,
+                        timeout=timeout,
+                        etag=etag,
+                    )
+                    # 304 Not Modified: the task is still in the state we parsed last time.
+                    payload = last_payload if fresh_payload is None else fresh_payload
+                    last_payload = payload
             state, detail = self._task_state_from_payload(payload)
-            state_class = self._classify_task_state(state)
-            if state_class == "success":
+            # _task_state_from_payload already upper-cases the state.
+            if state in TASK_STATE_CLASSES:
                 return state, detail
-            if state_class == "failure":
-                return state, detail
-            time.sleep(TASK_POLL_INTERVAL_SECONDS)
-
-    def _extract_doc_snapshot(self, doc: dict) -> dict:
-        return {
-            "modified": doc.get("modified"),
-            "content_length": int(doc.get("content_length") or 0),
-            "archive_filename": str(doc.get("archive_filename") or ""),
-            "page_count": doc.get("page_count"),
-        }
+            # Back off while the task sits in one state; a transition (PENDING -> STARTED)
+            # means it is moving, so poll it promptly again.
+            if state != last_state:
+                delay = TASK_POLL_INITIAL_DELAY_SECONDS
+                last_state = state
+            # A held long-poll already waited; only short responses need the poll delay.
+            if time.monotonic() - request_ts < delay:
+                # Event.wait returns as soon as Stop is pressed instead of finishing the sleep.
+                if self.stop_event.wait(delay + random.uniform(0, delay * TASK_POLL_JITTER_RATIO)):
+                    return "ABORTED", "Stopped by user"
+                delay = min(delay * TASK_POLL_BACKOFF_FACTOR, TASK_POLL_MAX_DELAY_SECONDS)
+
+    def _extract_doc_snapshot(self, doc: dict) -> DocSnapshot:
+        return DocSnapshot(
+            doc.get("modified"),
+            int(doc.get("content_length") or 0),
+            str(doc.get("archive_filename") or ""),
+            doc.get("page_count"),
+        )
 
-    def _diff_snapshot(self, before: dict, after: dict) -> list[tuple[str, object, object]]:
-        changed: list[tuple[str, object, object]] = []
-        for key in ("modified", "content_length", "archive_filename", "page_count"):
-            old = before.get(key)
-            new = after.get(key)
-            if old != new:
-                changed.append((key, old, new))
-        return changed
+    def _diff_snapshot(self, before: DocSnapshot, after: DocSnapshot) -> list[tuple[str, object, object]]:
+        # Most diff polls see an unchanged document; one tuple compare settles that.
+        if before == after:
+            return []
+        return [
+            (key, old, new)
+            for key, old, new in zip(DocSnapshot._fields, before, after)
+            if old != new
+        ]
 
     def _fetch_document_by_id(
         self,
@@ -1718,7 +2411,15 @@ class OcrDashboard(tb.Window):
         doc_id: int,
         timeout: int,
         verify_tls: bool,
+        max_age: float = 0.0,
     ) -> dict:
+        # Callers that can tolerate a snapshot up to max_age seconds old skip the GET; stale
+        # entries are never served, so diff polling always sees the server's current state.
+        if max_age > 0:
+            with self.doc_cache_lock:
+                cached = self._doc_cache.get(doc_id)
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
         payload = self._fetch_document_raw_by_id(
             base_url=base_url,
             headers=headers,
@@ -1726,13 +2427,108 @@ class OcrDashboard(tb.Window):
             timeout=timeout,
             verify_tls=verify_tls,
         )
-        return normalize_document(payload)
+        doc = normalize_document(payload)
+        with self.doc_cache_lock:
+            self._doc_cache[doc_id] = (time.monotonic(), doc)
+        return doc
 
-    def _poll_no_task_reprocess_diffs(
+    def _clear_doc_cache(self) -> None:
+        with self.doc_cache_lock:
+            self._doc_cache.clear()
+
+    def _fetch_documents_bulk(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        doc_ids: list[int],
+        timeout: int,
+        verify_tls: bool,
+    ) -> dict[int, dict]:
+        # One list request per chunk via the id__in filter. Only requested ids are kept, so a server
+        # that ignores the filter just yields misses, which the caller fetches one by one.
+        wanted = set(doc_ids)
+        found: dict[int, dict] = {}
+        for start in range(0, len(doc_ids), DOC_BULK_FETCH_CHUNK):
+            chunk = doc_ids[start : start + DOC_BULK_FETCH_CHUNK]
+            payload = self._api_get_json(
+                f"{base_url}/api/documents/?id__in={','.join(map(str, chunk))}&page_size={len(chunk)}",
+                headers=headers,
+                verify_tls=verify_tls,
+                timeout=timeout,
+            )
+            items = payload.get("results") if isinstance(payload, dict) else payload
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                doc = normalize_document(item)
+                if doc["id"] in wanted:
+                    found[doc["id"]] = doc
+        now = time.monotonic()
+        with self.doc_cache_lock:
+            for doc_id, doc in found.items():
+                self._doc_cache[doc_id] = (now, doc)
+        return found
+
+    def _fetch_documents(
         self,
         base_url: str,
         headers: dict[str, str],
-        baseline_snapshots: dict[int, dict],
+        doc_ids: list[int],
+        timeout: int,
+        verify_tls: bool,
+        max_age: float = 0.0,
+    ) -> dict[int, dict | Exception]:
+        results: dict[int, dict | Exception] = {}
+        if max_age > 0:
+            now = time.monotonic()
+            with self.doc_cache_lock:
+                for doc_id in doc_ids:
+                    cached = self._doc_cache.get(doc_id)
+                    if cached is not None and now - cached[0] < max_age:
+                        results[doc_id] = cached[1]
+        remaining = [doc_id for doc_id in doc_ids if doc_id not in results]
+        if len(remaining) > 1:
+            try:
+                results.update(
+                    self._fetch_documents_bulk(
+                        base_url=base_url,
+                        headers=headers,
+                        doc_ids=remaining,
+                        timeout=timeout,
+                        verify_tls=verify_tls,
+                    )
+                )
+            except Exception as exc:
+                self._emit(f"[WARN]  Bulk document fetch failed, falling back to per-ID requests: {exc}\n")
+            remaining = [doc_id for doc_id in remaining if doc_id not in results]
+
+        # Per-ID GETs for whatever the list request didn't return; also surfaces 404s per document.
+        def fetch(doc_id: int) -> dict | Exception:
+            try:
+                return self._fetch_document_by_id(
+                    base_url=base_url,
+                    headers=headers,
+                    doc_id=doc_id,
+                    timeout=timeout,
+                    verify_tls=verify_tls,
+                )
+            except Exception as exc:
+                return exc
+
+        if remaining:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(DOC_FETCH_MAX_WORKERS, len(remaining))
+            ) as pool:
+                results.update(zip(remaining, pool.map(fetch, remaining)))
+        return {doc_id: results[doc_id] for doc_id in doc_ids}
+
+    def _poll_no_task_reprocess_diffs(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        baseline_snapshots: dict[int, DocSnapshot],
         timeout: int,
         verify_tls: bool,
     ) -> tuple[set[int], set[int], set[int]]:
@@ -1741,31 +2537,32 @@ class OcrDashboard(tb.Window):
         no_observed_diff_ids: set[int] = set()
         stopped_ids: set[int] = set()
         start_ts = time.monotonic()
+        stop_is_set = self.stop_event.is_set
 
         if pending:
             self._emit(
                 "[INFO] Starting heuristic diff polling for accepted reprocess jobs without task_id.\n"
             )
 
-        while pending and not self.stop_event.is_set():
+        while pending and not stop_is_set():
             elapsed = time.monotonic() - start_ts
             if elapsed >= NO_TASK_DIFF_MAX_WAIT_SECONDS:
                 break
 
-            for doc_id in list(pending.keys()):
-                if self.stop_event.is_set():
+            # Fetch the whole pending set in one go each cycle, then diff in submission order.
+            current_docs = self._fetch_documents(
+                base_url=base_url,
+                headers=headers,
+                doc_ids=list(pending.keys()),
+                timeout=timeout,
+                verify_tls=verify_tls,
+            )
+            for doc_id, current_doc in current_docs.items():
+                if stop_is_set():
                     break
                 before = pending[doc_id]
-                try:
-                    current_doc = self._fetch_document_by_id(
-                        base_url=base_url,
-                        headers=headers,
-                        doc_id=doc_id,
-                        timeout=timeout,
-                        verify_tls=verify_tls,
-                    )
-                except Exception as exc:
-                    self._emit(f"[WARN]  ID={doc_id} (diff poll fetch error: {exc})\n")
+                if isinstance(current_doc, Exception):
+                    self._emit(f"[WARN]  ID={doc_id} (diff poll fetch error: {current_doc})\n")
                     continue
 
                 after = self._extract_doc_snapshot(current_doc)
@@ -1781,10 +2578,10 @@ class OcrDashboard(tb.Window):
                     )
                     pending.pop(doc_id, None)
 
-            if pending and not self.stop_event.is_set():
-                time.sleep(NO_TASK_DIFF_POLL_INTERVAL_SECONDS)
+            if pending:
+                self.stop_event.wait(NO_TASK_DIFF_POLL_INTERVAL_SECONDS)
 
-        if self.stop_event.is_set():
+        if stop_is_set():
             for doc_id in list(pending.keys()):
                 self._emit(f"[FAIL]  ID={doc_id} (stopped before diff observation)\n")
                 stopped_ids.add(doc_id)
@@ -1802,8 +2599,8 @@ class OcrDashboard(tb.Window):
 
     def refresh_all(self) -> None:
         try:
-            page_size = self._safe_int(self.page_size.get().strip(), "Page Size")
-            timeout = self._safe_int(self.timeout.get().strip(), "Timeout")
+            page_size = self._cached_int("page_size")
+            timeout = self._cached_int("timeout")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
@@ -1818,6 +2615,7 @@ class OcrDashboard(tb.Window):
 
         self._emit("\n=== DATA REFRESH START ===\n")
         self.paperless_fetch_status.set("Paperless overview last fetched: fetching...")
+        self._clear_doc_cache()
 
         def worker() -> None:
             try:
@@ -1828,14 +2626,19 @@ class OcrDashboard(tb.Window):
                     verify_tls=self.verify_tls.get(),
                     timeout=timeout,
                     progress_cb=lambda message: self._emit(message + "\n"),
+                    get_json=self._api_get_json,
                 )
                 success_rows, failed_rows = self._load_api_history_rows()
                 recent_ids = self._recent_manual_ocr_ids(
-                    rows=success_rows + failed_rows,
-                    within_days=self._safe_int(self.recent_days.get().strip(), "Exclude days"),
+                    within_days=self._cached_int("recent_days"),
                 )
 
+                docs_search_index = self._build_docs_search_index(docs)
+                docs_fields = self._build_docs_fields(docs)
                 self.docs = docs
+                self.docs_by_id = {d["id"]: d for d in docs}
+                self.docs_search_index = docs_search_index
+                self.docs_fields = docs_fields
                 self.success_rows = success_rows
                 self.failed_rows = failed_rows
                 self.recent_manual_ids = recent_ids
@@ -1859,78 +2662,267 @@ class OcrDashboard(tb.Window):
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _build_docs_search_index(self, docs: list[dict]) -> list[tuple[bytes, bytes]]:
+        index: list[tuple[bytes, bytes]] = []
+        for d in docs:
+            modified = str(d.get("modified") or "")
+            haystack = " ".join(
+                [
+                    str(d.get("id") or 0),
+                    str(d.get("title") or ""),
+                    str(d.get("archive_filename") or ""),
+                    str(d.get("original_filename") or ""),
+                    modified,
+                ]
+            )
+            index.append((haystack.casefold().encode("utf-8"), modified.casefold().encode("utf-8")))
+        return index
+
+    def _build_docs_fields(self, docs: list[dict]) -> list[tuple[int, str, int, str, str, str, int | None, str]]:
+        # (id, title, content_length, modified, archive_filename, original_filename, page_count, mime_type
+        # lower-cased), cast once per load so the refresh loops skip per-row .get()/int()/str() calls.
+        fields = []
+        for d in docs:
+            page_count_raw = d.get("page_count")
+            try:
+                page_count = None if page_count_raw is None else int(page_count_raw)
+            except (TypeError, ValueError):
+                page_count = None
+            fields.append(
+                (
+                    int(d.get("id") or 0),
+                    str(d.get("title") or ""),
+                    int(d.get("content_length") or 0),
+                    str(d.get("modified") or ""),
+                    str(d.get("archive_filename") or ""),
+                    str(d.get("original_filename") or ""),
+                    page_count,
+                    str(d.get("mime_type") or "").lower(),
+                )
+            )
+        return fields
+
+    def _current_docs_fields(self) -> list[tuple[int, str, int, str, str, str, int | None, str]]:
+        if len(self.docs_fields) != len(self.docs):
+            self.docs_fields = self._build_docs_fields(self.docs)
+        return self.docs_fields
+
     def _load_api_history_rows(self) -> tuple[list[dict], list[dict]]:
-        success_rows: list[dict] = []
-        failed_rows: list[dict] = []
-        if not self.history_file_path.exists():
-            return success_rows, failed_rows
+        with self.history_file_lock:
+            try:
+                st = self.history_file_path.stat()
+            except FileNotFoundError:
+                self._history_rows = ([], [])
+                self._history_latest = {}
+                self._history_offset = 0
+                self._history_inode = None
+                return [], []
+            if self._history_inode is None:
+                self._restore_history_cache(st)
+            # The file is append-only; a new inode or a shrink means it was replaced, so start over.
+            if st.st_ino != self._history_inode or st.st_size < self._history_offset:
+                self._history_rows = ([], [])
+                self._history_latest = {}
+                self._history_offset = 0
+                self._history_inode = st.st_ino
+            success_rows, failed_rows = self._history_rows
+            if st.st_size > self._history_offset:
+                self._read_history_tail(success_rows, failed_rows)
+            # Copies, so callers can't disturb the cached lists.
+            return list(success_rows), list(failed_rows)
+
+    def _restore_history_cache(self, st: os.stat_result) -> None:
+        # Called under history_file_lock. A cache covering a prefix of the current file is
+        # enough: the tail reader then parses only what was appended after it was saved.
+        try:
+            state = loads_json(self.history_cache_path.read_bytes())
+            version, inode, offset = state["version"], state["inode"], state["offset"]
+        except Exception:
+            return
+        if version != HISTORY_CACHE_VERSION or inode != st.st_ino or offset > st.st_size:
+            return
+        if offset > 0:
+            # The saved offset must still end a line, or the file was rewritten in place.
+            with self.history_file_path.open("rb") as f:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    return
+        source_file = str(self.history_file_path)
+        field_count = len(HISTORY_CACHE_FIELDS)
+        run_ts_key = SUCCESS_SORT_ROW_KEYS["run_ts"]
+        rows: tuple[list[dict], list[dict]] = ([], [])
+        try:
+            for target, cached_rows in zip(rows, (state["success"], state["failed"])):
+                is_success = target is rows[0]
+                for values in cached_rows:
+                    row = dict(zip(HISTORY_CACHE_FIELDS, values))
+                    row["source_file"] = source_file
+                    row["_doc_id"] = values[field_count]
+                    run_dt = values[field_count + 1]
+                    row["_run_dt"] = run_dt = None if run_dt is None else dt.datetime(*run_dt)
+                    if is_success:
+                        row[run_ts_key] = run_dt if run_dt is not None else dt.datetime.min
+                        row.update(zip(HISTORY_CACHE_SORT_KEYS, values[field_count + 2 :]))
+                    target.append(row)
+            # Stored as (doc_id, list, index) so each latest entry is the very row object in the lists.
+            latest = {int(doc_id): rows[which][idx] for doc_id, which, idx in state["latest"]}
+        except (KeyError, TypeError, ValueError, IndexError):
+            return
+        self._history_rows = rows
+        self._history_latest = latest
+        self._history_offset = offset
+        self._history_inode = inode
+        self._history_cache_key = (inode, offset)
 
+    def _save_history_cache(self) -> None:
         with self.history_file_lock:
-            with self.history_file_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    raw = line.strip()
-                    if not raw:
-                        continue
-                    try:
-                        payload = json.loads(raw)
-                    except json.JSONDecodeError:
-                        continue
-                    if not isinstance(payload, dict):
-                        continue
-                    row = {
-                        "run_ts": str(payload.get("run_ts", "")),
-                        "id": str(payload.get("id", "")),
-                        "title": str(payload.get("title", "")),
-                        "pre_content_length": str(payload.get("pre_content_length", "")),
-                        "post_content_length": str(payload.get("post_content_length", "")),
-                        "content_delta": str(payload.get("content_delta", "")),
-                        "status": str(payload.get("status", "")),
-                        "detail": str(payload.get("detail", "")),
-                        "source_file": str(self.history_file_path),
-                    }
-                    if row["status"].lower() == "success":
-                        success_rows.append(row)
-                    else:
-                        failed_rows.append(row)
-        return success_rows, failed_rows
+            if self._history_inode is None:
+                return
+            key = (self._history_inode, self._history_offset)
+            if key == self._history_cache_key:
+                return
+            # Plain JSON like the rest of data_memory: loading it can never run code.
+            positions: dict[int, tuple[int, int]] = {}
+            for which, rows in enumerate(self._history_rows):
+                for idx, row in enumerate(rows):
+                    positions[id(row)] = (which, idx)
+            state = {
+                "version": HISTORY_CACHE_VERSION,
+                "inode": key[0],
+                "offset": key[1],
+                "success": [
+                    self._history_cache_values(row, HISTORY_CACHE_SORT_KEYS) for row in self._history_rows[0]
+                ],
+                "failed": [self._history_cache_values(row, ()) for row in self._history_rows[1]],
+                "latest": [[doc_id, *positions[id(row)]] for doc_id, row in self._history_latest.items()],
+            }
+            tmp_path = self.history_cache_path.with_suffix(".tmp")
+            try:
+                if orjson is not None:
+                    tmp_path.write_bytes(orjson.dumps(state))
+                else:
+                    tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp_path, self.history_cache_path)
+                self._history_cache_key = key
+            except OSError as exc:
+                self._append_file_log(f"[WARN] Failed to write history cache {self.history_cache_path}: {exc}\n")
+
+    def _history_cache_values(self, row: dict, sort_keys: tuple[str, ...]) -> list:
+        run_dt = row["_run_dt"]
+        values = [row[field] for field in HISTORY_CACHE_FIELDS]
+        values.append(row["_doc_id"])
+        values.append(None if run_dt is None else run_dt.timetuple()[:6])
+        values.extend(row[key] for key in sort_keys)
+        return values
+
+    def _read_history_tail(self, success_rows: list[dict], failed_rows: list[dict]) -> None:
+        latest = self._history_latest
+        # Lines stay bytes: loads_json parses UTF-8 directly, no str decode per line.
+        with self.history_file_path.open("rb") as f:
+            f.seek(self._history_offset)
+            for line in f:
+                # A line without its newline is still being written; pick it up next time.
+                if not line.endswith(b"\n"):
+                    break
+                self._history_offset += len(line)
+                raw = line.strip()
+                if not raw:
+                    continue
+                try:
+                    payload = loads_json(raw)
+                except ValueError:
+                    continue
+                if not isinstance(payload, dict):
+                    continue
+                row = {
+                    "run_ts": str(payload.get("run_ts", "")),
+                    "id": str(payload.get("id", "")),
+                    "title": str(payload.get("title", "")),
+                    "pre_content_length": str(payload.get("pre_content_length", "")),
+                    "post_content_length": str(payload.get("post_content_length", "")),
+                    "content_delta": str(payload.get("content_delta", "")),
+                    "status": str(payload.get("status", "")),
+                    "detail": str(payload.get("detail", "")),
+                    "source_file": str(self.history_file_path),
+                }
+                # Parsed once here so recency filters and sorts don't re-run strptime per refresh.
+                row["_run_dt"] = run_dt = self._parse_run_ts_to_dt(row["run_ts"])
+                try:
+                    row["_doc_id"] = int(row["id"].strip())
+                except ValueError:
+                    row["_doc_id"] = None
+                if run_dt is not None and row["_doc_id"] is not None:
+                    previous = latest.get(row["_doc_id"])
+                    if previous is None or run_dt > previous["_run_dt"]:
+                        latest[row["_doc_id"]] = row
+                if row["status"].lower() == "success":
+                    # OCR History re-sorts on every refresh; build its keys once here.
+                    for field, row_key in SUCCESS_SORT_ROW_KEYS.items():
+                        row[row_key] = self._success_row_sort_key(row, field)
+                    success_rows.append(row)
+                else:
+                    failed_rows.append(row)
 
     def _parse_run_ts_to_dt(self, run_ts: str) -> dt.datetime | None:
         try:
+            # run_ts is written as zero-padded "%Y-%m-%d_%H%M%S"; slicing that layout avoids
+            # strptime's format parsing. Anything else still goes through strptime. int() would
+            # also take spaces and signs, so the fast path needs plain ASCII digits in every field.
+            if (
+                len(run_ts) == 17
+                and run_ts[4] == "-"
+                and run_ts[7] == "-"
+                and run_ts[10] == "_"
+                and run_ts.isascii()
+                and (run_ts[0:4] + run_ts[5:7] + run_ts[8:10] + run_ts[11:17]).isdigit()
+            ):
+                return dt.datetime(
+                    int(run_ts[0:4]),
+                    int(run_ts[5:7]),
+                    int(run_ts[8:10]),
+                    int(run_ts[11:13]),
+                    int(run_ts[13:15]),
+                    int(run_ts[15:17]),
+                )
             return dt.datetime.strptime(run_ts, "%Y-%m-%d_%H%M%S")
         except ValueError:
             return None
 
-    def _recent_manual_ocr_ids(self, rows: list[dict], within_days: int) -> set[int]:
+    def _latest_manual_ocr_rows(self) -> dict[int, dict]:
+        # Snapshot under the lock; worker threads extend the index while loading history.
+        with self.history_file_lock:
+            return dict(self._history_latest)
+
+    def _recent_manual_ocr_ids(self, within_days: int) -> set[int]:
         cutoff = dt.datetime.now() - dt.timedelta(days=within_days)
-        ids: set[int] = set()
-        for row in rows:
-            run_dt = self._parse_run_ts_to_dt(str(row.get("run_ts", "")))
-            if run_dt is None or run_dt < cutoff:
-                continue
-            try:
-                ids.add(int(str(row.get("id", "")).strip()))
-            except ValueError:
-                continue
-        return ids
+        return {doc_id for doc_id, row in self._latest_manual_ocr_rows().items() if row["_run_dt"] >= cutoff}
 
-    def _last_manual_ocr_map(self, rows: list[dict]) -> dict[int, str]:
-        last_map: dict[int, dt.datetime] = {}
-        for row in rows:
-            run_dt = self._parse_run_ts_to_dt(str(row.get("run_ts", "")))
-            if run_dt is None:
-                continue
-            try:
-                doc_id = int(str(row.get("id", "")).strip())
-            except ValueError:
-                continue
-            previous = last_map.get(doc_id)
-            if previous is None or run_dt > previous:
-                last_map[doc_id] = run_dt
-        return {doc_id: ts.strftime("%Y-%m-%d %H:%M:%S") for doc_id, ts in last_map.items()}
+    def _last_manual_ocr_map(self) -> dict[int, dt.datetime]:
+        return {doc_id: row["_run_dt"] for doc_id, row in self._latest_manual_ocr_rows().items()}
 
-    def _set_run_candidates(self, candidates: list[dict], summary_text: str) -> None:
+    def _last_manual_ocr_label(self, last_map: dict[int, dt.datetime], doc_id: int) -> str:
+        # Formatted on display, so only the rows actually shown pay for strftime.
+        run_dt = last_map.get(doc_id)
+        return "never" if run_dt is None else run_dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _build_manual_ocr_indexes(self, within_days: int) -> tuple[set[int], dict[int, dt.datetime]]:
+        # A doc was OCR'd within the window iff its latest run was, so one entry per doc is enough.
+        cutoff = dt.datetime.now() - dt.timedelta(days=within_days)
+        recent_ids: set[int] = set()
+        last_map: dict[int, dt.datetime] = {}
+        for doc_id, row in self._latest_manual_ocr_rows().items():
+            if row["_run_dt"] >= cutoff:
+                recent_ids.add(doc_id)
+            last_map[doc_id] = row["_run_dt"]
+        return recent_ids, last_map
+
+    def _set_run_candidates(
+        self, candidates: list[dict], summary_text: str, last_map: dict[int, dt.datetime] | None = None
+    ) -> None:
         self.selected_candidates = candidates
-        last_map = self._last_manual_ocr_map(self.success_rows + self.failed_rows)
+        self.selected_candidates_by_id = {int(d.get("id") or 0): d for d in candidates}
+        if last_map is None:
+            last_map = self._last_manual_ocr_map()
         rows = []
         for d in candidates:
             doc_id = int(d.get("id") or 0)
@@ -1940,7 +2932,7 @@ class OcrDashboard(tb.Window):
                     d.get("title") or "",
                     int(d.get("content_length") or 0),
                     d.get("modified") or "",
-                    last_map.get(doc_id, "never"),
+                    self._last_manual_ocr_label(last_map, doc_id),
                 )
             )
         self._fill_tree(self.run_tree, rows)
@@ -1953,47 +2945,44 @@ class OcrDashboard(tb.Window):
             return
 
         try:
-            batch_size = self._safe_int(self.batch_size.get().strip(), "Batch size")
-            recent_days = self._safe_int(self.recent_days.get().strip(), "Exclude days", minimum=0)
+            batch_size = self._cached_int("batch_size")
+            recent_days = self._cached_int("recent_days")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
 
-        recent_ids = self._recent_manual_ocr_ids(self.success_rows + self.failed_rows, within_days=recent_days)
+        recent_ids, last_map = self._build_manual_ocr_indexes(within_days=recent_days)
 
-        candidates = [d for d in self.docs if d.get("id") not in recent_ids]
-        # Prioritize docs with smallest OCR text first.
-        candidates.sort(key=lambda d: (int(d.get("content_length") or 0), int(d.get("id") or 0)))
-        selected = candidates[:batch_size]
+        # (content_length, id, doc) from the pre-cast fields; no per-doc .get()/int() here.
+        candidates = [
+            (f[2], f[0], d) for d, f in zip(self.docs, self._current_docs_fields()) if f[0] not in recent_ids
+        ]
+        # Prioritize docs with smallest OCR text first; only the batch needs ordering, not every doc.
+        selected = [entry[2] for entry in heapq.nsmallest(batch_size, candidates, key=operator.itemgetter(0, 1))]
         self._set_run_candidates(
             selected,
             (
                 "Candidates rebuilt from loaded overview: "
                 f"{len(selected)} selected from {len(self.docs)} docs "
                 f"(excluded recent manual OCR IDs: {len(recent_ids)})"
-            )
+            ),
+            last_map,
         )
 
     def refresh_success_tab(self) -> None:
+        if self._defer_if_unbuilt(self.tab_success):
+            return
         sort_field = self._selected_success_sort_key()
         descending = self.success_sort_order.get() == SUCCESS_SORT_ORDERS[0]
-        rows = []
-        for row in sorted(
+        ordered = sorted(
             self.success_rows,
-            key=lambda r: self._success_row_sort_key(r, sort_field),
+            key=operator.itemgetter(SUCCESS_SORT_ROW_KEYS[sort_field]),
             reverse=descending,
-        ):
-            rows.append(
-                (
-                    row.get("run_ts", ""),
-                    row.get("id", ""),
-                    row.get("title", ""),
-                    row.get("pre_content_length", ""),
-                    row.get("post_content_length", ""),
-                    row.get("content_delta", ""),
-                    row.get("status", ""),
-                )
-            )
+        )
+        columns = operator.itemgetter(
+            "run_ts", "id", "title", "pre_content_length", "post_content_length", "content_delta", "status"
+        )
+        rows = list(map(columns, ordered))
         self._fill_tree(self.success_tree, rows)
         self.success_summary.set(f"Successful OCR rows loaded: {len(rows)}")
 
@@ -2005,17 +2994,14 @@ class OcrDashboard(tb.Window):
             return
 
         try:
-            exclude_days = self._safe_int(self.recent_days.get().strip(), "Exclude days", minimum=0)
+            exclude_days = self._cached_int("recent_days")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
 
         self.success_rows = success_rows
         self.failed_rows = failed_rows
-        self.recent_manual_ids = self._recent_manual_ocr_ids(
-            rows=self.success_rows + self.failed_rows,
-            within_days=exclude_days,
-        )
+        self.recent_manual_ids = self._recent_manual_ocr_ids(within_days=exclude_days)
         self.refresh_success_tab()
         if self.docs:
             self.refresh_candidates()
@@ -2027,6 +3013,8 @@ class OcrDashboard(tb.Window):
         )
 
     def refresh_pipeline_overview(self) -> None:
+        if self._defer_if_unbuilt(self.tab_pipeline):
+            return
         try:
             rows = self._load_pipeline_events(limit=2000)
         except Exception as exc:
@@ -2068,48 +3056,58 @@ class OcrDashboard(tb.Window):
         )
 
     def refresh_prospective(self) -> None:
+        if self._defer_if_unbuilt(self.tab_prospective):
+            return
         if not self.docs:
             self.prospective_summary.set("No documents loaded. Click 'Fetch overview from Paperless'.")
             self._fill_tree(self.prospective_tree, [])
             return
 
         try:
-            threshold = self._safe_int(self.prospective_threshold.get().strip(), "Prospective threshold", minimum=0)
-            recent_days = self._safe_int(self.prospective_recent_days.get().strip(), "Prospective exclude days", minimum=0)
+            threshold = self._cached_int("prospective_threshold")
+            recent_days = self._cached_int("prospective_recent_days")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
 
-        recent_ids = self._recent_manual_ocr_ids(self.success_rows + self.failed_rows, within_days=recent_days)
-        last_map = self._last_manual_ocr_map(self.success_rows + self.failed_rows)
-
-        prospective: list[dict] = []
-        for d in self.docs:
-            doc_id = int(d.get("id") or 0)
-            if doc_id in recent_ids:
+        recent_ids, last_map = self._build_manual_ocr_indexes(within_days=recent_days)
+
+        # (content_length, id, row) so the sort compares plain tuples instead of calling a key per row.
+        keyed: list[tuple[int, int, dict]] = []
+        low_text_reason = f"low_text<{threshold}"
+        for doc_id, title, content_length, _, archive_filename, _, _, mime_type in self._current_docs_fields():
+            low_text = content_length < threshold
+            missing_archive = not archive_filename.strip()
+            pdf_zero_text = content_length == 0 and mime_type == "application/pdf"
+            # Most documents hit no reason at all; drop them before building any reason strings.
+            if not (low_text or missing_archive or pdf_zero_text) or doc_id in recent_ids:
                 continue
 
             reasons: list[str] = []
-            content_length = int(d.get("content_length") or 0)
-            if content_length < threshold:
-                reasons.append(f"low_text<{threshold}")
-            if not str(d.get("archive_filename") or "").strip():
+            if low_text:
+                reasons.append(low_text_reason)
+            if missing_archive:
                 reasons.append("missing_archive")
-            if str(d.get("mime_type") or "").lower() == "application/pdf" and content_length == 0:
+            if pdf_zero_text:
                 reasons.append("pdf_zero_text")
 
-            if reasons:
-                prospective.append(
+            keyed.append(
+                (
+                    content_length,
+                    doc_id,
                     {
                         "id": doc_id,
-                        "title": d.get("title") or "",
+                        "title": title,
                         "content_length": content_length,
                         "reason": ",".join(reasons),
-                        "last_manual_ocr": last_map.get(doc_id, "never"),
-                    }
+                        "last_manual_ocr": self._last_manual_ocr_label(last_map, doc_id),
+                    },
                 )
+            )
 
-        prospective.sort(key=lambda r: (r["content_length"], r["id"]))
+        # Every match is displayed, so this needs a full sort rather than a top-K selection.
+        keyed.sort(key=operator.itemgetter(0, 1))
+        prospective = [entry[2] for entry in keyed]
         self.prospective_rows = prospective
 
         rows = [(r["id"], r["title"], r["content_length"], r["reason"], r["last_manual_ocr"]) for r in prospective]
@@ -2119,10 +3117,18 @@ class OcrDashboard(tb.Window):
         )
 
     def _fill_tree(self, tree: ttk.Treeview, rows: list[tuple]) -> None:
-        for item in tree.get_children():
-            tree.delete(item)
+        tree_name = str(tree)
+        for cache_key in [key for key in self._sort_cache if key[0] == tree_name]:
+            del self._sort_cache[cache_key]
+        # One Tcl "delete" with every item instead of one call per row.
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        # Call Tcl directly: Treeview.insert() re-parses its keyword options for every row.
+        tk_call = tree.tk.call
+        widget = tree._w
         for row in rows:
-            tree.insert("", END, values=row)
+            tk_call(widget, "insert", "", END, "-values", row)
 
     def select_all_run_rows(self) -> None:
         items = self.run_tree.get_children("")
@@ -2156,14 +3162,7 @@ class OcrDashboard(tb.Window):
                 selected_ids.append(int(values[1]))
             except (TypeError, ValueError, IndexError):
                 continue
-        deduped: list[int] = []
-        seen: set[int] = set()
-        for doc_id in selected_ids:
-            if doc_id in seen:
-                continue
-            seen.add(doc_id)
-            deduped.append(doc_id)
-        return deduped
+        return list(dict.fromkeys(selected_ids))
 
     def _load_latest_llm_text(self, doc_id: int) -> tuple[str, str, dict] | None:
         conn = sqlite3.connect(str(self.pipeline_db_path))
@@ -2207,14 +3206,7 @@ class OcrDashboard(tb.Window):
                 ids.append(int(values[id_col_index]))
             except (TypeError, ValueError, IndexError):
                 continue
-        deduped: list[int] = []
-        seen: set[int] = set()
-        for doc_id in ids:
-            if doc_id in seen:
-                continue
-            seen.add(doc_id)
-            deduped.append(doc_id)
-        return deduped
+        return list(dict.fromkeys(ids))
 
     def export_from_active_tab(self) -> None:
         selected_doc_ids: list[int] = []
@@ -2291,7 +3283,7 @@ class OcrDashboard(tb.Window):
             )
             return
         try:
-            timeout = self._safe_int(self.timeout.get().strip(), "Timeout")
+            timeout = self._cached_int("timeout")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
@@ -2302,9 +3294,7 @@ class OcrDashboard(tb.Window):
         headers = self._api_headers(token)
         verify_tls = self.verify_tls.get()
 
-        self.run_total = len(doc_ids)
-        self.run_completed_ids = set()
-        self.run_started_ids = set()
+        self._reset_run_progress(doc_ids)
         self._set_progress_scope("RAG Export")
         self._render_progress()
         self.stop_event.clear()
@@ -2431,10 +3421,13 @@ class OcrDashboard(tb.Window):
             )
 
     def refresh_pdf_search(self) -> None:
+        if self._defer_if_unbuilt(self.tab_pdf_search):
+            return
         if not self.docs:
             self.pdf_summary.set("No documents loaded. Click 'Fetch overview from Paperless'.")
             self._fill_tree(self.pdf_tree, [])
             self.pdf_search_rows = []
+            self.pdf_search_by_id = {}
             return
 
         try:
@@ -2457,55 +3450,33 @@ class OcrDashboard(tb.Window):
             messagebox.showerror("Invalid input", "Pages max must be >= pages min")
             return
 
-        query = self.pdf_query.get().strip().lower()
-        modified_contains = self.pdf_modified_contains.get().strip().lower()
+        # UTF-8 substring matches are exact, so compare bytes against the precomputed index.
+        query = self.pdf_query.get().strip().casefold().encode("utf-8")
+        modified_contains = self.pdf_modified_contains.get().strip().casefold().encode("utf-8")
         missing_archive_only = self.pdf_missing_archive_only.get()
 
-        history_rows = self.success_rows + self.failed_rows
         recent_ids = (
-            self._recent_manual_ocr_ids(history_rows, within_days=exclude_recent_days)
+            self._recent_manual_ocr_ids(within_days=exclude_recent_days)
             if exclude_recent_days > 0
             else set()
         )
 
-        docs_to_search = list(self.docs)
-        filtered: list[dict] = []
+        search_index = self.docs_search_index
+        if len(search_index) != len(self.docs):
+            search_index = self._build_docs_search_index(self.docs)
+        # (content_length, id, row) so the sort compares plain tuples instead of calling a key per row.
+        keyed: list[tuple[int, int, dict]] = []
 
-        for d in docs_to_search:
-            doc_id = int(d.get("id") or 0)
-            if recent_ids and doc_id in recent_ids:
+        for fields, (haystack, modified_key) in zip(self._current_docs_fields(), search_index):
+            if query and query not in haystack:
+                continue
+            if modified_contains and modified_contains not in modified_key:
                 continue
 
-            title = str(d.get("title") or "")
-            archive_filename = str(d.get("archive_filename") or "")
-            original_filename = str(d.get("original_filename") or "")
-            modified = str(d.get("modified") or "")
-            content_length = int(d.get("content_length") or 0)
-
-            page_count_raw = d.get("page_count")
-            if page_count_raw is None:
-                page_count = None
-            else:
-                try:
-                    page_count = int(page_count_raw)
-                except (TypeError, ValueError):
-                    page_count = None
-
-            if query:
-                haystack = " ".join(
-                    [
-                        str(doc_id),
-                        title,
-                        archive_filename,
-                        original_filename,
-                        modified,
-                    ]
-                ).lower()
-                if query not in haystack:
-                    continue
-
-            if modified_contains and modified_contains not in modified.lower():
+            doc_id, title, content_length, modified, archive_filename, original_filename, page_count, _ = fields
+            if recent_ids and doc_id in recent_ids:
                 continue
+
             if missing_archive_only and archive_filename.strip():
                 continue
             if min_chars is not None and content_length < min_chars:
@@ -2517,20 +3488,26 @@ class OcrDashboard(tb.Window):
             if max_pages is not None and (page_count is None or page_count > max_pages):
                 continue
 
-            filtered.append(
-                {
-                    "id": doc_id,
-                    "title": title,
-                    "content_length": content_length,
-                    "page_count": page_count,
-                    "modified": modified,
-                    "archive_filename": archive_filename,
-                    "original_filename": original_filename,
-                }
+            keyed.append(
+                (
+                    content_length,
+                    doc_id,
+                    {
+                        "id": doc_id,
+                        "title": title,
+                        "content_length": content_length,
+                        "page_count": page_count,
+                        "modified": modified,
+                        "archive_filename": archive_filename,
+                        "original_filename": original_filename,
+                    },
+                )
             )
 
-        filtered.sort(key=lambda row: (row["content_length"], row["id"]))
+        keyed.sort(key=operator.itemgetter(0, 1))
+        filtered = [entry[2] for entry in keyed]
         self.pdf_search_rows = filtered
+        self.pdf_search_by_id = {entry[1]: entry[2] for entry in keyed}
 
         rows = [
             (
@@ -2547,7 +3524,7 @@ class OcrDashboard(tb.Window):
         self._fill_tree(self.pdf_tree, rows)
         self.pdf_summary.set(
             "Search results: "
-            f"{len(filtered)} of {len(docs_to_search)} documents "
+            f"{len(filtered)} of {len(self.docs)} documents "
             f"(exclude_recent_days={exclude_recent_days})"
         )
 
@@ -2595,7 +3572,7 @@ class OcrDashboard(tb.Window):
             messagebox.showinfo("No valid IDs", "Could not parse selected document IDs.")
             return
 
-        docs_by_id = {int(d["id"]): d for d in self.pdf_search_rows}
+        docs_by_id = self.pdf_search_by_id
         transfer_docs: list[dict] = []
         for doc_id in selected_ids:
             doc = docs_by_id.get(doc_id)
@@ -2648,7 +3625,7 @@ class OcrDashboard(tb.Window):
             messagebox.showinfo("No valid IDs", "Could not parse selected document IDs.")
             return
 
-        doc_by_id = {int(d.get("id") or 0): d for d in self.docs}
+        doc_by_id = self.docs_by_id
         transfer_docs: list[dict] = []
         for doc_id in selected_ids:
             doc = doc_by_id.get(doc_id)
@@ -2688,7 +3665,7 @@ class OcrDashboard(tb.Window):
             return
 
         try:
-            timeout = self._safe_int(self.timeout.get().strip(), "Timeout")
+            timeout = self._cached_int("timeout")
         except ValueError as exc:
             messagebox.showerror("Invalid input", str(exc))
             return
@@ -2701,7 +3678,7 @@ class OcrDashboard(tb.Window):
             )
             return
 
-        selected_docs_by_id = {int(d.get("id") or 0): d for d in self.selected_candidates}
+        selected_docs_by_id = self.selected_candidates_by_id
         run_docs: list[dict] = []
         missing_doc_ids: list[int] = []
         for doc_id in selected_doc_ids:
@@ -2732,9 +3709,7 @@ class OcrDashboard(tb.Window):
         }
         baseline_docs = {int(d.get("id") or 0): d for d in run_docs}
         run_ts = dt.datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        self.run_total = len(ids)
-        self.run_completed_ids = set()
-        self.run_started_ids = set()
+        self._reset_run_progress([int(x) for x in ids])
         if engine_mode == ENGINE_LLM:
             self._set_progress_scope("LLM OCR")
         else:
@@ -2792,7 +3767,6 @@ class OcrDashboard(tb.Window):
         timeout: int,
         verify_tls: bool,
     ) -> None:
-        archive_rows: list[dict] = []
         success_count = 0
         fail_count = 0
         try:
@@ -2894,33 +3868,49 @@ class OcrDashboard(tb.Window):
                 )
 
                 pre_len = int(baseline_docs.get(doc_id, {}).get("content_length") or 0)
-                archive_rows.append(
-                    {
-                        "run_ts": run_ts,
-                        "id": doc_id,
-                        "title": title,
-                        "pre_content_length": pre_len,
-                        "post_content_length": post_len,
-                        "content_delta": post_len - pre_len,
-                        "status": status,
-                        "detail": detail,
-                        "source": ENGINE_LLM,
-                    }
-                )
+                # Each LLM document takes long enough that its row goes to disk as soon as it is
+                # final; a stopped or crashed run keeps every row it finished.
+                row = {
+                    "run_ts": run_ts,
+                    "id": doc_id,
+                    "title": title,
+                    "pre_content_length": pre_len,
+                    "post_content_length": post_len,
+                    "content_delta": post_len - pre_len,
+                    "status": status,
+                    "detail": detail,
+                    "source": ENGINE_LLM,
+                }
+                self._history_writer_queue.put(([row], None))
         except Exception as exc:
             self._emit(f"[ERROR] LLM OCR worker crashed: {exc}\n")
         finally:
             self.api_run_active = False
-            self.after(0, self._update_control_states)
             self._emit(f"Summary: success={success_count} failed={fail_count} total={len(doc_ids)}\n")
             self._emit("=== OCR RUN END (llm) ===\n")
-            if archive_rows:
-                self._append_history_rows(archive_rows)
-                self.success_rows, self.failed_rows = self._load_api_history_rows()
-                self.after(0, self.refresh_success_tab)
-            self.after(0, self.refresh_pipeline_overview)
-            self.after(0, self._set_progress_scope, "Idle")
-            self.after(0, self._render_progress)
+            # Queued behind the streamed rows, so the UI reloads history once they are all written.
+            self._history_writer_queue.put(([], lambda: self.after(0, self._post_run_ui_refresh)))
+
+    def _submit_reprocess(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        doc_id: int,
+        timeout: int,
+        verify_tls: bool,
+    ) -> tuple[bool, dict | list | None]:
+        # Runs on the submit pool; (False, None) means Stop was pressed before the request went out.
+        if self.stop_event.is_set():
+            return False, None
+        self._emit(f"[START] ID={doc_id}\n")
+        payload = self._api_post_json(
+            url=f"{base_url}/api/documents/bulk_edit/",
+            headers=headers,
+            payload={"documents": [doc_id], "method": "reprocess"},
+            verify_tls=verify_tls,
+            timeout=timeout,
+        )
+        return True, payload
 
     def _run_api_reprocess_worker(
         self,
@@ -2928,7 +3918,7 @@ class OcrDashboard(tb.Window):
         headers: dict[str, str],
         doc_ids: list[int],
         baseline_docs: dict[int, dict],
-        baseline_snapshots: dict[int, dict],
+        baseline_snapshots: dict[int, DocSnapshot],
         run_ts: str,
         timeout: int,
         verify_tls: bool,
@@ -2937,30 +3927,71 @@ class OcrDashboard(tb.Window):
         accepted_no_task_observed = 0
         accepted_no_task_no_diff = 0
         submitted_tasks: list[tuple[int, str]] = []
-        no_task_baselines: dict[int, dict] = {}
+        no_task_baselines: dict[int, DocSnapshot] = {}
         emitted_no_task_hint = False
         doc_results: dict[int, dict[str, str]] = {
             doc_id: {"status": "pending", "detail": "not_submitted"} for doc_id in doc_ids
         }
-        archive_rows: list[dict] = []
+        # Ids without a terminal status yet, in run order; dict keys act as an ordered set.
+        pending_ids = dict.fromkeys(doc_ids)
+        # Never sent because of a stop; the final sweep overwrites their detail, so track them here.
+        unsent_ids: set[int] = set()
+        post_docs: dict[int, dict | Exception] = {}
+        # Archive rows stream to the history writer in chunks instead of accumulating for the whole run.
+        history_chunk: list[dict] = []
+        archived_count = 0
         success_count = 0
         fail_count = 0
+        stop_is_set = self.stop_event.is_set
 
         try:
-            for doc_id in doc_ids:
-                if self.stop_event.is_set():
-                    self._emit("[STOP] Submission loop stopped by user\n")
-                    break
-
-                self._emit(f"[START] ID={doc_id}\n")
-                try:
-                    payload = self._api_post_json(
-                        url=f"{base_url}/api/documents/bulk_edit/",
+            self._clear_doc_cache()
+            self._reset_task_listing()
+            self._server_supports_longpoll = self._probe_task_longpoll(
+                base_url=base_url,
+                headers=headers,
+                timeout=timeout,
+                verify_tls=verify_tls,
+            )
+            if self._server_supports_longpoll:
+                self._emit("[INFO] Server supports long-polling on /api/tasks/; using wait-based polling.\n")
+            # Submission, task polling and the post-run fetch are pipelined: each task is
+            # polled as soon as it is returned, and its document fetched once terminal.
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(TASK_POLL_MAX_WORKERS, len(doc_ids)))
+            )
+            poll_futures: dict[concurrent.futures.Future, int] = {}
+            # The bulk_edit POSTs go out a few at a time; their responses are still handled
+            # here, in submission order, so run state is only touched by this thread.
+            submit_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(TASK_SUBMIT_MAX_WORKERS, len(doc_ids)))
+            )
+            submit_futures = [
+                (
+                    doc_id,
+                    submit_pool.submit(
+                        self._submit_reprocess,
+                        base_url=base_url,
                         headers=headers,
-                        payload={"documents": [doc_id], "method": "reprocess"},
-                        verify_tls=verify_tls,
+                        doc_id=doc_id,
                         timeout=timeout,
-                    )
+                        verify_tls=verify_tls,
+                    ),
+                )
+                for doc_id in doc_ids
+            ]
+            stop_reported = False
+            for doc_id, submit_future in submit_futures:
+                if stop_is_set():
+                    submit_future.cancel()
+                try:
+                    sent, payload = (False, None) if submit_future.cancelled() else submit_future.result()
+                    if not sent:
+                        unsent_ids.add(doc_id)
+                        if not stop_reported:
+                            self._emit("[STOP] Submission loop stopped by user\n")
+                            stop_reported = True
+                        continue
                     task_ids = self._extract_task_ids(payload)
                     if not task_ids:
                         # Paperless 2.20.x commonly returns {"result":"OK"} without task IDs for bulk reprocess.
@@ -2969,7 +4000,7 @@ class OcrDashboard(tb.Window):
                             result_value = str(payload.get("result", "")).strip().upper()
                         if result_value == "OK":
                             accepted_no_task_count += 1
-                            no_task_baselines[doc_id] = baseline_snapshots.get(doc_id, {})
+                            no_task_baselines[doc_id] = baseline_snapshots.get(doc_id, EMPTY_DOC_SNAPSHOT)
                             doc_results[doc_id] = {
                                 "status": "pending",
                                 "detail": "accepted_by_api_no_task_id",
@@ -2986,48 +4017,54 @@ class OcrDashboard(tb.Window):
                                 "status": "failed",
                                 "detail": f"no_task_id_payload={payload}",
                             }
+                            pending_ids.pop(doc_id, None)
                             self._emit(
                                 f"[FAIL]  ID={doc_id} "
-                                "(no task_id returned from API, payload={payload})\n"
+                                f"(no task_id returned from API, payload={payload})\n"
                             )
                         continue
                     if len(task_ids) > 1:
                         self._emit(
                             f"[WARN]  ID={doc_id} API returned multiple task_ids; tracking first only: {','.join(task_ids)}\n"
                         )
-                    submitted_tasks.append((doc_id, task_ids[0]))
-                    doc_results[doc_id] = {"status": "pending", "detail": f"task_id={task_ids[0]}"}
-                    self._emit(f"[TASK]  ID={doc_id} task_id={task_ids[0]}\n")
+                    task_id = task_ids[0]
+                    submitted_tasks.append((doc_id, task_id))
+                    task_detail = f"task_id={task_id}"
+                    doc_results[doc_id] = {"status": "pending", "detail": task_detail}
+                    self._emit(f"[TASK]  ID={doc_id} {task_detail}\n")
+                    self._track_pending_task(1)
+                    poll_futures[
+                        pool.submit(
+                            self._poll_task_and_fetch_document,
+                            base_url=base_url,
+                            headers=headers,
+                            doc_id=doc_id,
+                            task_id=task_id,
+                            timeout=timeout,
+                            verify_tls=verify_tls,
+                        )
+                    ] = doc_id
                 except Exception as exc:
                     doc_results[doc_id] = {"status": "failed", "detail": f"submit_error={exc}"}
+                    pending_ids.pop(doc_id, None)
                     self._emit(f"[FAIL]  ID={doc_id} (submit error: {exc})\n")
+            submit_pool.shutdown()
 
-            for doc_id, task_id in submitted_tasks:
-                if self.stop_event.is_set():
-                    self._emit("[STOP] Poll loop stopped by user\n")
-                    break
-                state, detail = self._poll_task_until_terminal(
-                    base_url=base_url,
-                    headers=headers,
-                    task_id=task_id,
-                    timeout=timeout,
-                    verify_tls=verify_tls,
-                )
-                if self.stop_event.is_set():
-                    break
-                if self._classify_task_state(state) == "success":
-                    detail_text = f"task_state={state}"
-                    if detail:
-                        detail_text += f", {detail}"
-                    doc_results[doc_id] = {"status": "success", "detail": detail_text}
-                    self._emit(f"[OK]    ID={doc_id}\n")
-                else:
-                    suffix = f", detail={detail}" if detail else ""
-                    doc_results[doc_id] = {
-                        "status": "failed",
-                        "detail": f"task_state={state}{suffix}",
-                    }
-                    self._emit(f"[FAIL]  ID={doc_id} (task_state={state}{suffix})\n")
+            with pool:
+                for future in concurrent.futures.as_completed(poll_futures):
+                    doc_id = poll_futures[future]
+                    try:
+                        state, detail, latest_doc = future.result()
+                    except Exception as exc:
+                        state, detail, latest_doc = "ERROR", f"poll_error={exc}", None
+                    if latest_doc is not None:
+                        post_docs[doc_id] = latest_doc
+                    if stop_is_set():
+                        continue
+                    self._apply_task_poll_result(doc_results, doc_id, state, detail)
+                    pending_ids.pop(doc_id, None)
+            if submitted_tasks and stop_is_set():
+                self._emit("[STOP] Poll loop stopped by user\n")
 
             if no_task_baselines:
                 observed_ids, no_diff_ids, stopped_ids = self._poll_no_task_reprocess_diffs(
@@ -3045,44 +4082,70 @@ class OcrDashboard(tb.Window):
                     doc_results[doc_id] = {"status": "success", "detail": "accepted_no_observed_diff"}
                 for doc_id in stopped_ids:
                     doc_results[doc_id] = {"status": "failed", "detail": "stopped_before_diff_observation"}
+                for doc_id in observed_ids | no_diff_ids | stopped_ids:
+                    pending_ids.pop(doc_id, None)
 
-            for doc_id in doc_ids:
-                state = doc_results.get(doc_id, {}).get("status", "pending")
-                if state != "pending":
-                    continue
-                if self.stop_event.is_set():
+            for doc_id in pending_ids:
+                if stop_is_set():
                     doc_results[doc_id] = {"status": "failed", "detail": "stopped_before_completion"}
                     self._emit(f"[FAIL]  ID={doc_id} (stopped before completion)\n")
                 else:
                     doc_results[doc_id] = {"status": "failed", "detail": "incomplete_without_terminal_status"}
                     self._emit(f"[FAIL]  ID={doc_id} (incomplete without terminal status)\n")
 
-            for doc_id in doc_ids:
-                pre_len = int(baseline_snapshots.get(doc_id, {}).get("content_length") or 0)
-                base_title = str(baseline_docs.get(doc_id, {}).get("title") or "")
-                title = base_title
-                post_len = pre_len
-                detail = doc_results.get(doc_id, {}).get("detail", "")
-                status = doc_results.get(doc_id, {}).get("status", "failed")
-
-                try:
-                    latest_doc = self._fetch_document_by_id(
+            missing_ids = [
+                doc_id
+                for doc_id in doc_ids
+                if doc_id not in post_docs
+                and doc_id not in unsent_ids
+                and not doc_results[doc_id]["detail"].startswith(POST_FETCH_SKIP_DETAIL_PREFIXES)
+            ]
+            if missing_ids:
+                post_docs.update(
+                    self._fetch_documents(
                         base_url=base_url,
                         headers=headers,
-                        doc_id=doc_id,
+                        doc_ids=missing_ids,
                         timeout=timeout,
                         verify_tls=verify_tls,
+                        max_age=DOC_SNAPSHOT_CACHE_TTL_SECONDS,
                     )
-                    title = str(latest_doc.get("title") or title)
-                    post_len = int(latest_doc.get("content_length") or 0)
-                except Exception as exc:
+                )
+
+            pre_lens = {
+                doc_id: snapshot.content_length
+                for doc_id, snapshot in baseline_snapshots.items()
+            }
+            base_titles = {doc_id: str(doc.get("title") or "") for doc_id, doc in baseline_docs.items()}
+            pipeline_events: list[dict] = []
+            for doc_id in doc_ids:
+                pre_len = pre_lens.get(doc_id, 0)
+                title = base_titles.get(doc_id, "")
+                post_len = pre_len
+                result = doc_results[doc_id]
+                detail = result["detail"]
+                status = result["status"]
+
+                # Docs skipped by the post-run fetch keep their baseline title and length.
+                latest_doc = post_docs.get(doc_id)
+                if isinstance(latest_doc, Exception):
+                    exc = latest_doc
                     if detail:
                         detail += f" | post_fetch_error={exc}"
                     else:
                         detail = f"post_fetch_error={exc}"
                     self._emit(f"[WARN]  ID={doc_id} (post-run snapshot fetch failed: {exc})\n")
+                elif latest_doc is not None:
+                    title = str(latest_doc.get("title") or title)
+                    post_len = int(latest_doc.get("content_length") or 0)
 
-                archive_rows.append(
+                if status == "success":
+                    row_status = "success"
+                    success_count += 1
+                else:
+                    row_status = "failed"
+                    fail_count += 1
+                history_chunk.append(
                     {
                         "run_ts": run_ts,
                         "id": doc_id,
@@ -3090,28 +4153,30 @@ class OcrDashboard(tb.Window):
                         "pre_content_length": pre_len,
                         "post_content_length": post_len,
                         "content_delta": post_len - pre_len,
-                        "status": "success" if status == "success" else "failed",
+                        "status": row_status,
                         "detail": detail,
                         "source": "api_bulk_reprocess",
                     }
                 )
-                self._record_pipeline_event(
-                    doc_id=doc_id,
-                    title=title,
-                    action="paperless_reprocess",
-                    engine=ENGINE_PAPERLESS,
-                    status="success" if status == "success" else "failed",
-                    note=detail,
+                archived_count += 1
+                if len(history_chunk) >= HISTORY_STREAM_CHUNK_ROWS:
+                    self._history_writer_queue.put((history_chunk, None))
+                    history_chunk = []
+                pipeline_events.append(
+                    {
+                        "doc_id": doc_id,
+                        "title": title,
+                        "action": "paperless_reprocess",
+                        "engine": ENGINE_PAPERLESS,
+                        "status": row_status,
+                        "note": detail,
+                    }
                 )
-
-            success_count = sum(1 for row in archive_rows if row.get("status") == "success")
-            fail_count = len(archive_rows) - success_count
-            self._append_history_rows(archive_rows)
+            self._record_pipeline_events(pipeline_events)
         except Exception as exc:
             self._emit(f"[ERROR] API OCR worker crashed: {exc}\n")
         finally:
             self.api_run_active = False
-            self.after(0, self._update_control_states)
             self._emit(f"Summary: success={success_count} failed={fail_count} total={len(doc_ids)}\n")
             if accepted_no_task_count:
                 self._emit(
@@ -3120,16 +4185,66 @@ class OcrDashboard(tb.Window):
                     f"observed_diff={accepted_no_task_observed} "
                     f"no_observed_diff={accepted_no_task_no_diff}\n"
                 )
-            if archive_rows:
+            if archived_count:
                 self._emit(
-                    f"[INFO] Appended API OCR archive rows={len(archive_rows)} file={self.history_file_path}\n"
+                    f"[INFO] Appended API OCR archive rows={archived_count} file={self.history_file_path}\n"
                 )
             self._emit("=== OCR RUN END (api) ===\n")
-            self.success_rows, self.failed_rows = self._load_api_history_rows()
-            self.after(0, self.refresh_success_tab)
-            self.after(0, self.refresh_pipeline_overview)
-            self.after(0, self._set_progress_scope, "Idle")
-            self.after(0, self._render_progress)
+            self._history_writer_queue.put((history_chunk, lambda: self.after(0, self._post_run_ui_refresh)))
+
+    def _poll_task_and_fetch_document(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        doc_id: int,
+        task_id: str,
+        timeout: int,
+        verify_tls: bool,
+    ) -> tuple[str, str, dict | Exception | None]:
+        try:
+            state, detail = self._poll_task_until_terminal(
+                base_url=base_url,
+                headers=headers,
+                task_id=task_id,
+                timeout=timeout,
+                verify_tls=verify_tls,
+            )
+        finally:
+            self._track_pending_task(-1)
+        if self.stop_event.is_set():
+            return state, detail, None
+        try:
+            latest_doc: dict | Exception = self._fetch_document_by_id(
+                base_url=base_url,
+                headers=headers,
+                doc_id=doc_id,
+                timeout=timeout,
+                verify_tls=verify_tls,
+            )
+        except Exception as exc:
+            latest_doc = exc
+        return state, detail, latest_doc
+
+    def _apply_task_poll_result(
+        self,
+        doc_results: dict[int, dict[str, str]],
+        doc_id: int,
+        state: str,
+        detail: str,
+    ) -> None:
+        if self._classify_task_state(state) == "success":
+            detail_text = f"task_state={state}"
+            if detail:
+                detail_text += f", {detail}"
+            doc_results[doc_id] = {"status": "success", "detail": detail_text}
+            self._emit(f"[OK]    ID={doc_id}\n")
+        else:
+            suffix = f", detail={detail}" if detail else ""
+            doc_results[doc_id] = {
+                "status": "failed",
+                "detail": f"task_state={state}{suffix}",
+            }
+            self._emit(f"[FAIL]  ID={doc_id} (task_state={state}{suffix})\n")
 
     def stop_run(self) -> None:
         if not self.api_run_active and not self.export_active:
@@ -3150,6 +4265,13 @@ class OcrDashboard(tb.Window):
                 pass
             self._settings_autosave_after_id = None
         self._save_settings(show_error=False)
+        # Let queued history rows reach disk before the process exits.
+        self._history_writer_queue.put(None)
+        self._history_writer_thread.join(timeout=5.0)
+        self._save_history_cache()
+        self._close_api_pools()
+        self._file_log_queue.put(None)
+        self._file_log_thread.join(timeout=5.0)
         self.destroy()
 
 